@@ -0,0 +1,75 @@
+"""
+Shared JSON input/output for the parser scripts
+(parse_verbs.py, parse_docx_production.py, validate.py, snapshot_baseline.py,
+regression_validator.py)
+"""
+
+import json
+from pathlib import Path
+from types import ModuleType
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for streamed output files (the default is 8 KB)
+WRITE_BUFFER = 1 << 20
+
+
+def dump_json(data, indent: bool = True) -> bytes:
+    """Serialize as UTF-8 JSON, indented or compact (orjson when installed, same bytes as json.dumps)"""
+    if orjson is not None:
+        # NON_STR_KEYS: json.dumps writes None/int dict keys as "null"/"1"
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_json(path, data, indent: bool = True, atomic: bool = False) -> None:
+    """Write data to path as UTF-8 JSON in a single binary write
+
+    atomic: write a sibling temp file and rename it over path, so a reader
+    never sees a half-written file.
+    """
+    path = Path(path)
+    payload = dump_json(data, indent)
+    if not atomic:
+        path.write_bytes(payload)
+        return
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(payload)
+    tmp.replace(path)
+
+
+def write_verbs_json(path, verbs: list, metadata: dict) -> None:
+    """Stream {"verbs": [...], "metadata": {...}} one verb at a time (same bytes as dump_json)"""
+    with open(path, 'wb', buffering=WRITE_BUFFER) as f:
+        if not verbs:
+            f.write(b'{\n  "verbs": [],\n')
+        else:
+            f.write(b'{\n  "verbs": [\n')
+            last = len(verbs) - 1
+            for i, verb in enumerate(verbs):
+                # A nested value is its standalone dump indented one level per depth
+                f.write(b'    ' + dump_json(verb).replace(b'\n', b'\n    '))
+                f.write(b',\n' if i < last else b'\n')
+            f.write(b'  ],\n')
+        f.write(b'  "metadata": ' + dump_json(metadata).replace(b'\n', b'\n  ') + b'\n}')
+
+
+def parse_json(data: bytes):
+    """Parse UTF-8 JSON bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path):
+    """Read a UTF-8 JSON file (orjson when installed)"""
+    return parse_json(Path(path).read_bytes())
@@ -82,12 +82,223 @@ AGENT 3 FINDINGS:
 QUALITY STATUS: 99.93% Turoyo completeness (target), 11.4% NULL etymology (down from 13.2%)
 """
 
+import contextlib
+import io
 import re
-import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from docx import Document
 from collections import defaultdict
 
+from json_output import write_json, write_verbs_json
+
+# Characters that end a plain-text run in _split_raw_to_tokens: opening quotes, notes, punctuation
+_RAW_SPECIAL = re.compile(r'[ʻ\u2018\u201C\'"\[;,:()]')
+
+# Paragraph classification (is_root_paragraph, is_stem_header, extract_stem_info).
+# Root letters include combining diacritics (U+0300-U+036F) for decomposed
+# characters like ḏ̣ (ḏ + combining dot below).
+_ROOT_CANDIDATE = re.compile(r'^([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou\u0300-\u036F]{2,12})(?:\s+\d+)?(?:\s|\(|<|$)')
+_CROSS_REF_MARKER = re.compile(r'→|see\s+[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ]', re.IGNORECASE)
+_ETYMOLOGY_MARKER = re.compile(r'\([<>][\s?]*[A-Za-z.]+')
+_STEM_MARKER = re.compile(r'^([IVX]+|Pa\.|Af\.|Št\.|Šaf\.):\s*')
+_STEM_MARKER_LINE = re.compile(r'^([IVX]+|Pa\.|Af\.|Št\.|Šaf\.):\s*(.+)')
+_SPECIAL_STEM_HEADER = re.compile(r'^(Detransitive|Action Noun|Infinitiv):?$', re.IGNORECASE)
+_IMPLICIT_STEM_CHARS = r'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeioù-ͯ'
+_IMPLICIT_STEM_START = re.compile(rf'^[{_IMPLICIT_STEM_CHARS}]{{3,}}')
+_IMPLICIT_STEM_SLASH_FORMS = re.compile(rf'^[{_IMPLICIT_STEM_CHARS}]+(?:/\s*[{_IMPLICIT_STEM_CHARS}]+)+')
+_IMPLICIT_STEM_FORMS = re.compile(rf'^([{_IMPLICIT_STEM_CHARS}][^\s]*(?:/\s*[^\s]+)*)')
+_STEM_FORMS = re.compile(r'^(\S+(?:\s*\([^)]+\))?(?:/\S+(?:\s*\([^)]+\))?)*)')
+_SPECIAL_STEM_FORMS = re.compile(r'^[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou\u0300-\u036F]+(?:/[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou\u0300-\u036F]+)*$')
+# Canonical special stem names by the first letter of the matched header (otherwise Infinitiv)
+_SPECIAL_STEM_NAMES = {'d': 'Detransitive', 'a': 'Action Noun'}
+_IDIOMS_HEADER = re.compile(r'^(Idiomatic phrases?|Idioms?):?$', re.IGNORECASE)
+
+# Root line: root, cross-reference and gloss (extract_root_and_etymology)
+_ROOT = re.compile(r'^([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?)(?:\s|\(|<|$)')
+_CROSS_REFERENCE = re.compile(r'\bsee\s+(?:also\s+)?([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?(?:,\s*[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?)*)', re.IGNORECASE)
+_ROOT_GLOSS = re.compile(r'\(([^<].+)\)')
+_EDITORIAL_GLOSS = re.compile(r'unknown|\?{3}|SL |note:', re.IGNORECASE)
+
+# Etymology variants, in the order parse_etymology_full tries them. Every variant
+# needs one of these anchors ('(' may be followed by whitespace; Pattern 1's
+# "(<" contains '<'), so text without any is not an etymology
+_ETYM_ANCHOR = re.compile(r'<|\(\s*(?:[A-Z]|cf\.|(?i:denom)|see|unknown)')
+_ETYM_TRAILING_LIST_NUMBER = re.compile(r'\.\s+\d+$')
+_ETYM_PAREN_SPACE = re.compile(r'\(\s+<')
+_ETYM_NO_OPEN_PAREN = re.compile(r'^\S+\s+<\s*([^<>]+?)\)(?:,\s+cf\.|;|\s+|$)')
+_ETYM_BARE_SOURCE = re.compile(r'(?:^|[\s\d])<\s*([A-Z][^<>]+?)\)(?:\s|$|;)')
+_ETYM_CORPUS = re.compile(r'[A-Z]\w+\s+(?:text|corpus|Talay)')
+_ETYM_CF = re.compile(r'\(\s+cf\.\s+(.+)\)(?:\s|$)')
+_ETYM_SPACE_PAREN = re.compile(r'\(\s+([A-Z][A-Z])')
+_ETYM_DENOMINAL = re.compile(r'\((denom\.?\s+[^)]+)\)', re.IGNORECASE)
+_ETYM_SEE = re.compile(r'\(((?:see|cf\.|unknown)[^)]+)\)')
+_ETYM_UNCLOSED = re.compile(r'\(<\s*(.+)$')
+_ETYM_CLOSING = re.compile(r'^(.+?)\)')
+_ETYM_AND = re.compile(r'[;,]\s*and\s+')
+
+# Etymon shapes (parse_single_etymon)
+_ETYMON_STRUCTURED = re.compile(r'([A-Za-z.]+)\s+([^\s]+)\s+(?:\([^)]+\)\s+)?cf\.\s+([^:]+):\s*(.+)', re.DOTALL)
+_ETYMON_NO_CF = re.compile(r'([A-Za-z.]+)\s+([^\s,]+),\s+([^:]+):\s*(.+)', re.DOTALL)
+_ETYMON_CF_SYR = re.compile(r'cf\.\s+([A-Za-z.]+)\s+([^\s,]+)\s+(?:\([^)]+\),?\s+)?([A-Za-z]+\s+[\d.]+):\s*(.+)', re.DOTALL)
+_ETYMON_FKD = re.compile(r'([A-Z]{2,})[;,]\s+(\d+)\s+(.+)', re.DOTALL)
+_ETYMON_SEE = re.compile(r'(?:see|cf\.)\s+(.+)', re.DOTALL)
+_ETYMON_SIMPLE = re.compile(r'([A-Za-z.]+)\s+(.+)')
+
+# References inside raw example text (_split_raw_to_tokens), in order of specificity:
+# 1. + Leb Beg s.66/100 (cross-ref with lowercase abbrev)
+# 2. s.66/100 or s. 66/100 (lowercase abbreviation + numbers)
+# 3. LB 147, Leb 24/147 (uppercase start + 0-3 letters + numbers)
+# 4. 24/147, 66/100 (just numbers)
+_REFERENCE = re.compile(
+    r'(?:'
+    r'\+\s*[A-Z][a-zA-Z\s]+[a-z]+\.\s*\d+(?:[./]\d+)*'  # + Leb Beg s.66/100
+    r'|(?<![A-Za-z])[a-z]+\.\s*\d+(?:[./]\d+)*'  # s.66/100 or s. 66/100
+    r'|(?<![A-Za-z])[A-Z][A-Za-z]{0,3}\s+\d+(?:[./]\d+)*'  # LB 147
+    r'|(?<!\d)\d{1,3}(?:[./]\d+)*'  # 24/147 (max 3 digits, not part of year)
+    r')(?=(?:[^\w]|$))'
+)
+
+# Non-translation filters (is_valid_translation)
+_CAPS_REFERENCE = re.compile(r'^[A-Z]{1,3}\s+\d+')
+_SIGLUM = re.compile(r'^\[?[A-Z]{2,5}\]?;?$')
+_PRS_CF_REFERENCE = re.compile(r'^(prs|cf\.)\s+\d+')
+_NUMBERS_ONLY = re.compile(r'^[\d;/\s\[\]]+$')
+_CYRILLIC_ONLY = re.compile(r'^[А-Яа-я\s]+$')
+_LOWERCASE_LETTER = re.compile(r'[a-zäöüß]')
+
+_LIST_NUMBER_PREFIX = re.compile(r'^\d+\)\s*')
+
+# Turoyo-specific characters that rarely appear in German/English (is_likely_turoyo)
+_TUROYO_MARKER_CHARS = 'ʔʕḏṯṣṭḥǧġšžəāēīū'
+
+# Single forms with optional reference (is_form_only_entry). Includes combining
+# diacritics (U+0300-U+036F) and Latin Extended (U+00C0-U+017F) for é, í, à.
+_FORM_CHARS = r'[a-zāēīūəǝʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ\u0300-\u036F\u00C0-\u017F\s\-=]'
+_FORM_WITH_REF = re.compile(rf'^{_FORM_CHARS}+;\s*\d+\s*;\s*$', re.IGNORECASE)
+_FORM_VARIANTS_WITH_REF = re.compile(rf'^{_FORM_CHARS}+(?:;\s*{_FORM_CHARS}+)+;\s*\d+\s*;\s*$', re.IGNORECASE)
+_FORM_WITH_PARENS = re.compile(rf'^{_FORM_CHARS}+!?\s*\([^\)]+\)$', re.IGNORECASE)
+
+# At least two Turoyo/form characters anywhere in a variant part (extract_variant_forms)
+_VARIANT_FORM_CHAR = r'[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou\-=]'
+_VARIANT_FORM_CHAR_PAIR = re.compile(rf'{_VARIANT_FORM_CHAR}.*?{_VARIANT_FORM_CHAR}', re.DOTALL)
+
+# Reference/metadata lines (is_reference_only). Case-sensitive patterns are kept
+# apart: with IGNORECASE, ^[A-Z][a-z]+-[A-Z] (for "Xori-Caziz") also matched
+# Turoyo prefixes like "ko-məbġəḏ". Both sets go into one alternation,
+# the case-sensitive ones scoped with (?-i:...), so a line is classified
+# with a single match call.
+_METADATA_CASE_SENSITIVE = (
+    r'^[A-Z][a-z]+\s+p\.c\.',         # Personal communication (John p.c.)
+    r'^[A-Z][a-z]+_[A-Z]',            # Name_Code (Smith_J)
+    r'^[A-Z][a-z]+-[A-Z]',            # Name-Code (Xori-Caziz)
+    r'^[A-Z][a-z]+\s+\d{1,2},\s*\d{4}',  # January 23, 2024
+)
+_METADATA_CASE_INSENSITIVE = (
+    r'^\d{4}_\d{2}_\d{2}',            # Date format (2024_01_23)
+    r'^\([A-Za-z\s]+\s+\d+',          # (Text number
+    r'^\[\d{1,2}:\d{2}\s*[AP]M,\s*\d{1,2}/\d{1,2}/\d{4}\]',  # [8:30 AM, 1/23/2024]
+    r'^\d{1,2}:\d{2}\s*[AP]M',        # 8:30 AM
+    r'^\(See\s+[a-zʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ]+',  # (See root)
+    r'^\(Compare\s+',                 # (Compare ...)
+    r'^\(cf\.\s+[a-zʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ]+\s*\d*\)',  # (cf. root 1)
+)
+_METADATA_LINE = re.compile(
+    '|'.join([f'(?-i:{pattern})' for pattern in _METADATA_CASE_SENSITIVE] + list(_METADATA_CASE_INSENSITIVE)),
+    re.IGNORECASE,
+)
+
+_DIGITS = re.compile(r'^\d+$')
+
+# Table cells (parse_table_cell): reference-only lines and "N) " item numbers
+# (1-2 digits, so years like 2018 in "(Notes 2018)" don't split)
+_REFERENCE_ONLY_LINE = re.compile(r'^[\d\s;/,]+$')
+_ITEM_NUMBER = re.compile(r'(?:^|\s)(\d{1,2})\)\s')
+
+# Idioms
+_NOT_IDIOM_HEADER = re.compile(r'^(Detransitive|Idiomatic phrases?|Idioms?|Examples?|Collocations?):?$', re.IGNORECASE)
+_DETRANS_MARKER = re.compile(r'^\(Detrans\.?\)', re.IGNORECASE)
+_NUMBERED_MEANINGS = re.compile(r'^\d+\)\s+.+;\s*\d+\)\s+.+;')
+_IDIOM_TUROYO_START = re.compile(r'^[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ]', re.UNICODE)
+_IDIOM_TUROYO_RUN = re.compile(r'[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ]+', re.UNICODE)
+_QUOTATION_MARK = re.compile(r'[ʻʼ\'"]')
+_QUOTED_PHRASE = re.compile(r'[ʻʼ\'"]([^ʻʼ\'"]+)[ʻʼ\'"]')
+_IDIOM_REFERENCE = re.compile(r'\b(\d+/\d+|\d+:\d+)\b')
+_IDIOM_VERB_FORM = re.compile(r's[əo]mle[/]soy[əo]m|soy[əo]m[/]s[əo]mle')
+_TRAILING_SEMICOLON = re.compile(r'[;][\s]*$')
+_IDIOM_MEANING = re.compile(r'[ʻ\u2018\u201c\']([^ʻʼ\u2018\u2019\u201c\u201d\']+?)[ʼ\u2019\u201d\']')
+_TRAILING_SEPARATORS = re.compile(r'[:;]+$')
+_LEADING_SEPARATORS = re.compile(r'^[:;]+\s*')
+
+_HOMONYM_NUMBER = re.compile(r'\s+\d+$')
+
+
+class _MatchLike:
+    """Stand-in for re.Match when parse_etymology_full extracts the content by hand"""
+    __slots__ = ('_content',)
+
+    def __init__(self, content):
+        self._content = content
+
+    def group(self, n):
+        return self._content if n == 1 else None
+
+
+def _quoted_spans(text, open_quote, close_quote, min_len=1):
+    """Contents of open_quote ... close_quote spans of at least min_len chars
+
+    Same result as re.findall(rf'{open}(.{{{min_len},}}?){close}', text, re.DOTALL),
+    found with str.find: the closing quote is the first one at least min_len
+    chars after the opening quote, and the next span starts after it.
+    """
+    spans = []
+    find = text.find
+    pos = find(open_quote)
+    while pos != -1:
+        close = find(close_quote, pos + 1 + min_len)
+        if close == -1:
+            # No later opening quote can be closed either
+            break
+        spans.append(text[pos + 1:close])
+        pos = find(open_quote, close + 1)
+    return spans
+
+
+def _etymology_signature(etymology):
+    """Fields of the first etymon that tell homonyms apart, or None without etymons"""
+    if not etymology or not etymology.get('etymons'):
+        return None
+    first_etymon = etymology['etymons'][0]
+    return (
+        first_etymon.get('source', ''),
+        first_etymon.get('source_root', ''),
+        first_etymon.get('notes', ''),
+        first_etymon.get('raw', ''),
+        first_etymon.get('reference', '')
+    )
+
+
+def _find_matching_paren(text, open_pos):
+    """Index just past the ')' closing the '(' at open_pos, or -1 if it is never closed"""
+    depth = 1
+    next_open = text.find('(', open_pos + 1)
+    i = open_pos + 1
+    while True:
+        close = text.find(')', i)
+        if close == -1:
+            return -1
+        # Every '(' before this ')' nests one level deeper
+        while next_open != -1 and next_open < close:
+            depth += 1
+            next_open = text.find('(', next_open + 1)
+        depth -= 1
+        if depth == 0:
+            return close + 1
+        i = close + 1
+
+
 class FixedDocxParser:
     """Complete DOCX parser with all accuracy fixes"""
 
@@ -98,28 +309,64 @@ class FixedDocxParser:
         self.pending_idiom_paras = []
         self.in_idioms_section = False
         self.consumed_para_indices = set()  # Track paragraphs used as stem glosses
+        self.run_formats = {}  # Paragraph element -> (has_italic, has_11pt)
+        self.style_names = {}  # w:pStyle id -> resolved paragraph style name
+        self.para_texts = {}  # Paragraph element -> para.text
 
     def is_letter_header(self, para):
-        return para.style and para.style.name == 'Heading 1'
+        # para.style resolves the style id through the document's style list
+        # (a full scan for the default style) on every access; the raw id is
+        # one attribute read, so names are resolved once per id
+        style_id = para._p.style
+        if style_id not in self.style_names:
+            style = para.style
+            self.style_names[style_id] = style.name if style else None
+        return self.style_names[style_id] == 'Heading 1'
+
+    def run_formatting(self, para):
+        """(has_italic, has_11pt) for a paragraph's runs
+
+        Every run attribute is an lxml lookup in python-docx, and the same
+        paragraph is checked as next_para and again as para, so the result
+        is cached per paragraph element.
+        """
+        key = para._element
+        formatting = self.run_formats.get(key)
+        if formatting is None:
+            runs = para.runs
+            formatting = (
+                any(r.italic for r in runs),
+                11.0 in [r.font.size.pt for r in runs if r.font.size],
+            )
+            self.run_formats[key] = formatting
+        return formatting
+
+    def paragraph_text(self, para):
+        """para.text, read once per paragraph element
+
+        python-docx rebuilds the text from the runs with XPath queries on every
+        access, and the same paragraph is read by the lookahead, the classifiers
+        and the main loop.
+        """
+        key = para._element
+        text = self.para_texts.get(key)
+        if text is None:
+            text = self.para_texts[key] = para.text
+        return text
 
     def is_root_paragraph(self, para, next_para=None):
-        if not para.text.strip():
+        text = self.paragraph_text(para).strip()
+        if not text:
             return False
 
-        text = para.text.strip()
-        turoyo_chars = r'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou'
-        # CRITICAL FIX: Include combining diacritics (U+0300-U+036F) to handle decomposed characters like ḏ̣ (ḏ + combining dot below)
-        turoyo_with_combining = rf'[{turoyo_chars}\u0300-\u036F]'
-
-        has_root = re.match(rf'^({turoyo_with_combining}{{2,12}})(?:\s+\d+)?(?:\s|\(|<|$)', text)
-        is_cross_ref = bool(re.search(r'→|see\s+[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ]', text, re.IGNORECASE))
-
-        if not has_root or is_cross_ref:
+        # CRITICAL FIX: _ROOT_CANDIDATE includes combining diacritics (U+0300-U+036F) for decomposed characters
+        # The anchored root match rejects most paragraphs, so the unanchored
+        # cross-reference scan only runs on root candidates
+        has_root = _ROOT_CANDIDATE.match(text)
+        if not has_root or _CROSS_REF_MARKER.search(text):
             return False
 
-        has_italic = any(r.italic for r in para.runs)
-        sizes = [r.font.size.pt for r in para.runs if r.font.size]
-        has_11pt = 11.0 in sizes
+        has_italic, has_11pt = self.run_formatting(para)
 
         if has_italic and has_11pt:
             return True
@@ -127,7 +374,7 @@ class FixedDocxParser:
         if next_para and self.is_stem_header(next_para):
             # If next paragraph is a stem marker, be more aggressive about accepting this as a root
             # Check for etymology markers (< with optional ?, >, or other prefix characters)
-            has_etymology = bool(re.search(r'\([<>][\s?]*[A-Za-z.]+', text))
+            has_etymology = bool(_ETYMOLOGY_MARKER.search(text))
             # Check if text starts with a valid Turoyo root pattern
             has_valid_root_pattern = bool(has_root)
             # Check for common root indicators (parentheses with content, which usually indicates etymology)
@@ -142,16 +389,16 @@ class FixedDocxParser:
         return False
 
     def is_stem_header(self, para, next_elem_is_table=False):
-        if not para.text.strip():
+        text = self.paragraph_text(para).strip()
+        if not text:
             return False
 
-        text = para.text.strip()
-        has_stem = re.match(r'^([IVX]+|Pa\.|Af\.|Št\.|Šaf\.):\s*', text)
+        has_stem = _STEM_MARKER.match(text)
 
         if not has_stem:
             # BUGFIX: Recognize "Detransitive", "Action Noun", and "Infinitiv" as stem headers
             # Use regex for robust matching (case insensitive, optional colon)
-            if re.match(r'^(Detransitive|Action Noun|Infinitiv):?$', text, re.IGNORECASE):
+            if _SPECIAL_STEM_HEADER.match(text):
                 return True
 
             # BUGFIX: Detect freeform stem lines without explicit markers (e.g., "mǧəqle/moǧaq SL 23-8-2025: ...")
@@ -160,9 +407,8 @@ class FixedDocxParser:
                 # Check if line starts with italic Turoyo forms (verb conjugations)
                 # Pattern: starts with Turoyo characters, has italic formatting
                 has_italic = any(r.italic for r in para.runs if r.text.strip())
-                turoyo_chars = r'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeioù-ͯ'
-                turoyo_start = re.match(rf'^[{turoyo_chars}]{{3,}}', text)
-                slash_forms = re.match(rf'^[{turoyo_chars}]+(?:/\s*[{turoyo_chars}]+)+', text)
+                turoyo_start = _IMPLICIT_STEM_START.match(text)
+                slash_forms = _IMPLICIT_STEM_SLASH_FORMS.match(text)
 
                 # If starts with Turoyo and has italic runs, treat as implicit Stem I
                 # Also allow non-italic rows when they are clearly Turoyo slash-separated forms
@@ -178,6 +424,10 @@ class FixedDocxParser:
     def parse_etymology_full(self, text, next_para_text=None):
         """Full etymology parsing with multi-paragraph support and flexible patterns"""
 
+        # One scan for the anchors of all patterns instead of failing each in turn
+        if not _ETYM_ANCHOR.search(text):
+            return None
+
         # Try multiple patterns in order of specificity
 
         # Pattern 1: Standard (< Source root cf. ref: meaning)
@@ -186,16 +436,9 @@ class FixedDocxParser:
         paren_start = text.find('(<')
         if paren_start >= 0:
             # Find matching closing paren by counting depth
-            depth = 1
-            i = paren_start + 1
-            while i < len(text) and depth > 0:
-                if text[i] == '(':
-                    depth += 1
-                elif text[i] == ')':
-                    depth -= 1
-                i += 1
+            i = _find_matching_paren(text, paren_start)
 
-            if depth == 0:
+            if i != -1:
                 # Found matching closing paren
                 etym_content = text[paren_start+2:i-1].strip()
 
@@ -207,7 +450,7 @@ class FixedDocxParser:
                 text_after_paren = text[i:].strip()
                 if next_para_text and text_after_paren and next_para_text.endswith(')'):
                     # Check if etymology ends with ". N" pattern (incomplete list item)
-                    if re.search(r'\.\s+\d+$', etym_content):
+                    if _ETYM_TRAILING_LIST_NUMBER.search(etym_content):
                         # This is malformed - include text after paren and next para
                         # Remove the spurious closing paren from etym_content
                         continuation = text_after_paren + ' ' + next_para_text
@@ -217,51 +460,34 @@ class FixedDocxParser:
                         if last_paren > 0:
                             etym_content = etym_content[:last_paren].strip()
 
-                class MatchLike:
-                    def __init__(self, content):
-                        self._content = content
-                    def group(self, n):
-                        return self._content if n == 1 else None
-                match = MatchLike(etym_content)
+                match = _MatchLike(etym_content)
 
         # Pattern 1b: FIX - Missing opening paren with space '( <Source' (ngl 2, zyr 2 bug)
         if not match:
-            paren_space_start = re.search(r'\(\s+<', text)
+            paren_space_start = _ETYM_PAREN_SPACE.search(text)
             if paren_space_start:
                 paren_pos = paren_space_start.start()
                 # Find matching closing paren by counting depth
-                depth = 1
-                i = paren_pos + 1
-                while i < len(text) and depth > 0:
-                    if text[i] == '(':
-                        depth += 1
-                    elif text[i] == ')':
-                        depth -= 1
-                    i += 1
+                i = _find_matching_paren(text, paren_pos)
 
-                if depth == 0:
+                if i != -1:
                     # Extract content between ( and ), skip the '(' and any whitespace before '<'
                     etym_content = text[paren_pos+1:i-1].strip()
                     if etym_content.startswith('<'):
                         etym_content = etym_content[1:].strip()
-                    class MatchLike:
-                        def __init__(self, content):
-                            self._content = content
-                        def group(self, n):
-                            return self._content if n == 1 else None
-                    match = MatchLike(etym_content)
+                    match = _MatchLike(etym_content)
 
         # Pattern 2: NO opening paren at all - root <Source... text with closing paren later
         # Example: ḏyr <Ar. ḍrr 'to harm, damage'), cf. Turk...
         if not match:
             # Look for: root_chars followed by space, then <Source with closing paren later
-            no_open_paren = re.search(r'^\S+\s+<\s*([^<>]+?)\)(?:,\s+cf\.|;|\s+|$)', text)
+            no_open_paren = _ETYM_NO_OPEN_PAREN.search(text)
             if no_open_paren:
                 match = no_open_paren
 
         # Pattern 3: Missing opening paren - just <Source... (alternative form)
         if not match:
-            match = re.search(r'(?:^|[\s\d])<\s*([A-Z][^<>]+?)\)(?:\s|$|;)', text)
+            match = _ETYM_BARE_SOURCE.search(text)
 
         # Pattern 4: Corpus/text reference - (Text_name ... info)
         # Example: (Talay text (Khabur-Assyrer) 1.1.68 gwille lebe 'es wurde ihm übel' unknown)
@@ -271,74 +497,49 @@ class FixedDocxParser:
             if paren_start >= 0:
                 # Look for first word after opening paren
                 after_paren = text[paren_start+1:].strip()
-                if re.match(r'[A-Z]\w+\s+(?:text|corpus|Talay)', after_paren):
+                if _ETYM_CORPUS.match(after_paren):
                     # This looks like a corpus reference
                     # Find matching closing paren by counting
-                    depth = 1
-                    i = paren_start + 1
-                    while i < len(text) and depth > 0:
-                        if text[i] == '(':
-                            depth += 1
-                        elif text[i] == ')':
-                            depth -= 1
-                        i += 1
-                    if depth == 0:
+                    i = _find_matching_paren(text, paren_start)
+                    if i != -1:
                         # Found matching closing paren
                         etym_content = text[paren_start+1:i-1].strip()
-                        # Create a match-like object
-                        class MatchLike:
-                            def __init__(self, content):
-                                self._content = content
-                            def group(self, n):
-                                return self._content if n == 1 else None
-                        match = MatchLike(etym_content)
+                        match = _MatchLike(etym_content)
 
         # Pattern 4: FIX - 'cf.' without '<' (ʕngr case)
         if not match:
-            cf_pattern = re.search(r'\(\s+cf\.\s+(.+)\)(?:\s|$)', text)
+            cf_pattern = _ETYM_CF.search(text)
             if cf_pattern:
                 match = cf_pattern
 
         # Pattern 5: FIX - Space before opening paren for FKD references (sxy case)
         if not match:
-            space_paren = re.search(r'\(\s+([A-Z][A-Z])', text)
+            space_paren = _ETYM_SPACE_PAREN.search(text)
             if space_paren:
                 paren_pos = space_paren.start()
-                depth = 1
-                i = paren_pos + 1
-                while i < len(text) and depth > 0:
-                    if text[i] == '(':
-                        depth += 1
-                    elif text[i] == ')':
-                        depth -= 1
-                    i += 1
-                if depth == 0:
+                i = _find_matching_paren(text, paren_pos)
+                if i != -1:
                     etym_content = text[paren_pos+1:i-1].strip()
-                    class MatchLike:
-                        def __init__(self, content):
-                            self._content = content
-                        def group(self, n):
-                            return self._content if n == 1 else None
-                    match = MatchLike(etym_content)
+                    match = _MatchLike(etym_content)
 
         # Pattern 6: AGENT 2 FIX - Denominal without '<' (HIGH PRIORITY - 10-15 recoveries)
         # Example: šrqm (denom. RW 502 šaqmo 'Feige, Ohrfeige'+r; cf. MEA SL 1598...)
         if not match:
-            denom_pattern = re.search(r'\((denom\.?\s+[^)]+)\)', text, re.IGNORECASE)
+            denom_pattern = _ETYM_DENOMINAL.search(text)
             if denom_pattern:
                 match = denom_pattern
 
         # Pattern 7: Alternative start patterns (see X, cf. X, unknown)
         if not match:
-            match = re.search(r'\(((?:see|cf\.|unknown)[^)]+)\)', text)
+            match = _ETYM_SEE.search(text)
 
         # Pattern 7: Multi-paragraph - unclosed paren
         if not match and next_para_text:
             # Check if text has opening paren but no closing
-            paren_match = re.search(r'\(<\s*(.+)$', text)
+            paren_match = _ETYM_UNCLOSED.search(text)
             if paren_match:
                 # Look for closing paren in next paragraph
-                close_match = re.search(r'^(.+?)\)', next_para_text)
+                close_match = _ETYM_CLOSING.search(next_para_text)
                 if close_match:
                     # Combine both paragraphs
                     combined = paren_match.group(1) + ' ' + close_match.group(1)
@@ -354,7 +555,7 @@ class FixedDocxParser:
                         etymon_parts = [part.strip() for part in etym_text.split(' also ')]
                     elif '; and ' in etym_text or ', and ' in etym_text:
                         relationship = 'and'
-                        etymon_parts = [part.strip() for part in re.split(r'[;,]\s*and\s+', etym_text)]
+                        etymon_parts = [part.strip() for part in _ETYM_AND.split(etym_text)]
 
                     etymons = []
                     for part in etymon_parts:
@@ -384,7 +585,7 @@ class FixedDocxParser:
             etymon_parts = [part.strip() for part in etym_text.split(' also ')]
         elif '; and ' in etym_text or ', and ' in etym_text:
             relationship = 'and'
-            etymon_parts = [part.strip() for part in re.split(r'[;,]\s*and\s+', etym_text)]
+            etymon_parts = [part.strip() for part in _ETYM_AND.split(etym_text)]
 
         etymons = []
         for part in etymon_parts:
@@ -408,10 +609,7 @@ class FixedDocxParser:
         etym_text_normalized = etym_text.replace('Ar.', 'Arab.')
 
         # Pattern 1: Arab. bdl (II) cf. Wehr 71-72: verändern, umändern...
-        structured = re.match(
-            r'([A-Za-z.]+)\s+([^\s]+)\s+(?:\([^)]+\)\s+)?cf\.\s+([^:]+):\s*(.+)',
-            etym_text_normalized, re.DOTALL
-        )
+        structured = _ETYMON_STRUCTURED.match(etym_text_normalized)
         if structured:
             return {
                 'source': structured.group(1).strip(),
@@ -421,10 +619,7 @@ class FixedDocxParser:
             }
 
         # Pattern 2: Without cf - Arab. bdl, Wehr 71-72: verändern...
-        no_cf = re.match(
-            r'([A-Za-z.]+)\s+([^\s,]+),\s+([^:]+):\s*(.+)',
-            etym_text_normalized, re.DOTALL
-        )
+        no_cf = _ETYMON_NO_CF.match(etym_text_normalized)
         if no_cf:
             return {
                 'source': no_cf.group(1).strip(),
@@ -434,10 +629,7 @@ class FixedDocxParser:
             }
 
         # Pattern 3: FIX - 'cf. Syr. root (Pa.), SL ref: meaning' (ʕngr case)
-        cf_syr_pattern = re.match(
-            r'cf\.\s+([A-Za-z.]+)\s+([^\s,]+)\s+(?:\([^)]+\),?\s+)?([A-Za-z]+\s+[\d.]+):\s*(.+)',
-            etym_text, re.DOTALL
-        )
+        cf_syr_pattern = _ETYMON_CF_SYR.match(etym_text)
         if cf_syr_pattern:
             return {
                 'source': cf_syr_pattern.group(1).strip(),
@@ -447,10 +639,7 @@ class FixedDocxParser:
             }
 
         # Pattern 4: FIX - FKD references like 'FKD; 1493 sexî adj. ar. généreux' (sxy case)
-        fkd_pattern = re.match(
-            r'([A-Z]{2,})[;,]\s+(\d+)\s+(.+)',
-            etym_text, re.DOTALL
-        )
+        fkd_pattern = _ETYMON_FKD.match(etym_text)
         if fkd_pattern:
             return {
                 'source': fkd_pattern.group(1).strip(),
@@ -459,7 +648,7 @@ class FixedDocxParser:
             }
 
         # Pattern 5: "see X" or "cf. X" pattern - e.g., "see Tezel 71; cf. probably Syr..."
-        see_pattern = re.match(r'(?:see|cf\.)\s+(.+)', etym_text, re.DOTALL)
+        see_pattern = _ETYMON_SEE.match(etym_text)
         if see_pattern:
             return {
                 'notes': self.normalize_whitespace(see_pattern.group(0)),
@@ -474,7 +663,7 @@ class FixedDocxParser:
             }
 
         # Pattern 5: Simple source + notes
-        simple = re.match(r'([A-Za-z.]+)\s+(.+)', etym_text)
+        simple = _ETYMON_SIMPLE.match(etym_text)
         if simple:
             source = simple.group(1).strip()
             notes = simple.group(2).strip()
@@ -493,19 +682,21 @@ class FixedDocxParser:
     def normalize_whitespace(self, text):
         if not text:
             return ""
-        return re.sub(r'\s+', ' ', text).strip()
+        # str.split() splits on exactly the characters \s matches, so this equals
+        # re.sub(r'\s+', ' ', text).strip() without a regex pass
+        return ' '.join(text.split())
 
     def extract_root_and_etymology(self, text, next_para_text=None):
         text = text.strip()
         # CRITICAL FIX: Include combining diacritics to match decomposed characters
-        root_match = re.match(r'^([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?)(?:\s|\(|<|$)', text)
+        root_match = _ROOT.match(text)
         if not root_match:
             return None, None, None, None
 
         root = root_match.group(1).strip()
 
         # Check for cross-reference pattern (e.g., "see ǧġl1", "see also šġl3")
-        cross_ref_match = re.search(r'\bsee\s+(?:also\s+)?([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?(?:,\s*[ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ\u0300-\u036F]{2,12}(?:\s+\d+)?)*)', text, re.IGNORECASE)
+        cross_ref_match = _CROSS_REFERENCE.search(text)
         cross_reference = cross_ref_match.group(1).strip() if cross_ref_match else None
 
         # Parse full etymology with multi-paragraph support
@@ -515,23 +706,23 @@ class FixedDocxParser:
         root_gloss = None
         if not etymology:
             # No etymology marker found, check for simple gloss in parentheses
-            gloss_match = re.search(r'\(([^<].+)\)', text)
+            gloss_match = _ROOT_GLOSS.search(text)
             if gloss_match:
                 potential_gloss = gloss_match.group(1).strip()
                 # Filter out "unknown" and editorial notes
-                if not re.search(r'unknown|\?{3}|SL |note:', potential_gloss, re.IGNORECASE):
+                if not _EDITORIAL_GLOSS.search(potential_gloss):
                     root_gloss = potential_gloss
 
         return root, etymology, root_gloss, cross_reference
 
     def extract_stem_info(self, text):
-        match = re.match(r'^([IVX]+|Pa\.|Af\.|Št\.|Šaf\.):\s*(.+)', text.strip())
+        match = _STEM_MARKER_LINE.match(text.strip())
 
         if not match:
             # BUGFIX: Handle implicit stems (no marker, just forms and notes)
             # Example: "mǧəqle/moǧaq SL 23-8-2025: the verb looks like..."
             # Check if this starts with Turoyo characters (likely forms)
-            implicit_match = re.match(r'^([ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeioù-ͯ][^\s]*(?:/\s*[^\s]+)*)', text.strip())
+            implicit_match = _IMPLICIT_STEM_FORMS.match(text.strip())
             if implicit_match:
                 # Extract forms from the beginning
                 forms_str = implicit_match.group(1)
@@ -545,7 +736,7 @@ class FixedDocxParser:
 
         stem_num = match.group(1)
         forms_text = match.group(2).strip()
-        forms_match = re.match(r'^(\S+(?:\s*\([^)]+\))?(?:/\S+(?:\s*\([^)]+\))?)*)', forms_text)
+        forms_match = _STEM_FORMS.match(forms_text)
         if forms_match:
             forms_str = forms_match.group(1)
             forms = [f.strip() for f in forms_str.split('/') if f.strip()]
@@ -567,7 +758,7 @@ class FixedDocxParser:
         tokens = []
 
         # Find the starting position of target_text in the full paragraph text
-        full_text = para.text
+        full_text = self.paragraph_text(para)
         start_pos = full_text.find(target_text)
 
         if start_pos == -1:
@@ -607,46 +798,52 @@ class FixedDocxParser:
 
     def extract_translations_improved(self, cell_text):
         """Extract translations with comprehensive quote handling"""
-        translations = []
+        # Insertion-ordered dict: dedupes as it goes, first occurrence wins
+        translations = {}
+        normalize = self.normalize_whitespace
+
+        def add(matches, min_len):
+            for t in matches:
+                if len(t.strip()) > min_len:
+                    t = normalize(t)
+                    if len(t) > 3:
+                        translations[t] = None
+
+        # Each pass only runs when its opening delimiter is in the cell at all;
+        # passes stay separate because their matches may overlap
+        # (e.g. ʻ…ʼ nested inside "…") and both are kept
+        has_curly = 'ʻ' in cell_text
+        has_straight = "'" in cell_text
 
         # Pattern 1: Curly quotes ʻ...ʼ (U+02BB ... U+02BC) - most common
-        # Use non-greedy to avoid spanning multiple quotes
-        curly = re.findall(r'ʻ(.+?)ʼ', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in curly if len(t.strip()) > 3])
+        # Shortest span, to avoid spanning multiple quotes
+        if has_curly:
+            add(_quoted_spans(cell_text, 'ʻ', 'ʼ'), 3)
 
         # Pattern 1b: Typographic single quotes ‘ … ’ (U+2018/U+2019)
-        curly_single = re.findall(r'‘(.+?)’', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in curly_single if len(t.strip()) > 3])
+        if '\u2018' in cell_text:
+            add(_quoted_spans(cell_text, '\u2018', '\u2019'), 3)
 
         # Pattern 1c: Typographic double quotes “ … ” (U+201C/U+201D)
-        curly_double = re.findall(r'“(.+?)”', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in curly_double if len(t.strip()) > 3])
+        if '\u201C' in cell_text:
+            add(_quoted_spans(cell_text, '\u201C', '\u201D'), 3)
 
         # Pattern 2: Straight single quotes '...' (U+0027)
-        # Use non-greedy and require substantial length to avoid Turoyo contractions
-        straight_single = re.findall(r'\'(.{15,}?)\'', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in straight_single if len(t.strip()) > 15])
+        # Require substantial length to avoid Turoyo contractions
+        if has_straight:
+            add(_quoted_spans(cell_text, "'", "'", 15), 15)
 
         # Pattern 3: Double quotes "..."
-        double = re.findall(r'\"(.+?)\"', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in double if len(t.strip()) > 3])
+        if '"' in cell_text:
+            add(_quoted_spans(cell_text, '"', '"'), 3)
 
         # Pattern 4: Mixed curly+straight quotes (ʻtext' or 'textʼ)
-        mixed1 = re.findall(r'ʻ(.{10,}?)\'', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in mixed1 if len(t.strip()) > 10])
-        mixed2 = re.findall(r'\'(.{10,}?)ʼ', cell_text, re.DOTALL)
-        translations.extend([self.normalize_whitespace(t) for t in mixed2 if len(t.strip()) > 10])
-
-        # Deduplicate while preserving order
-        seen = set()
-        unique_translations = []
-        for t in translations:
-            t_clean = t.strip()
-            if t_clean and len(t_clean) > 3 and t_clean not in seen:
-                seen.add(t_clean)
-                unique_translations.append(t_clean)
-
-        return unique_translations
+        if has_curly and has_straight:
+            add(_quoted_spans(cell_text, 'ʻ', "'", 10), 10)
+        if has_straight and 'ʼ' in cell_text:
+            add(_quoted_spans(cell_text, "'", 'ʼ', 10), 10)
+
+        return list(translations)
 
     def _split_raw_to_tokens(self, raw: str):
         """Split non-italic raw text into translation/ref/note/punct/text tokens
@@ -671,19 +868,6 @@ class FixedDocxParser:
             '"': '"',  # Straight double quote
         }
 
-        # Reference patterns (in order of specificity):
-        # 1. + Leb Beg s.66/100 (cross-ref with lowercase abbrev)
-        # 2. s.66/100 or s. 66/100 (lowercase abbreviation + numbers)
-        # 3. LB 147, Leb 24/147 (uppercase start + 0-3 letters + numbers)
-        # 4. 24/147, 66/100 (just numbers)
-        ref_regex = re.compile(
-            r'(?:'
-            r'\+\s*[A-Z][a-zA-Z\s]+[a-z]+\.\s*\d+(?:[./]\d+)*'  # + Leb Beg s.66/100
-            r'|(?<![A-Za-z])[a-z]+\.\s*\d+(?:[./]\d+)*'  # s.66/100 or s. 66/100
-            r'|(?<![A-Za-z])[A-Z][A-Za-z]{0,3}\s+\d+(?:[./]\d+)*'  # LB 147
-            r'|(?<!\d)\d{1,3}(?:[./]\d+)*'  # 24/147 (max 3 digits, not part of year)
-            r')(?=(?:[^\w]|$))'
-        )
 
         def is_apostrophe_not_quote(pos):
             """Check if character at pos is an apostrophe in a word (not a closing quote)"""
@@ -701,18 +885,11 @@ class FixedDocxParser:
                 close = quote_pairs[c]
 
                 # Find closing quote, but skip apostrophes within words
-                j = i + 1
-                while j < n:
-                    if raw[j] == close:
-                        # Check if this is an apostrophe (not a closing quote)
-                        if is_apostrophe_not_quote(j):
-                            j += 1  # Skip this apostrophe, keep looking
-                            continue
-                        # Found real closing quote
-                        break
-                    j += 1
+                j = raw.find(close, i + 1)
+                while j != -1 and is_apostrophe_not_quote(j):
+                    j = raw.find(close, j + 1)  # Skip this apostrophe, keep looking
 
-                if j < n:  # Found closing quote
+                if j != -1:  # Found closing quote
                     push('translation', raw[i:j+1])
                     i = j + 1
                     continue
@@ -733,7 +910,7 @@ class FixedDocxParser:
                 continue
 
             # Reference
-            m = ref_regex.match(raw, i)
+            m = _REFERENCE.match(raw, i)
             if m:
                 push('ref', m.group(0))
                 i = m.end()
@@ -745,13 +922,20 @@ class FixedDocxParser:
                 i += 1
                 continue
 
-            # Whitespace or other text - accumulate until next special
-            j = i + 1
-            while j < n:
-                cj = raw[j]
-                if (cj in quote_pairs) or cj == '[' or cj in ';,:()' or ref_regex.match(raw, j):
-                    break
-                j += 1
+            # Whitespace or other text - accumulate until next special or reference.
+            # Both are found with one search each rather than a _REFERENCE.match per
+            # character; a reference never spans a special character, so the
+            # reference search can stop after it. The special itself stays inside
+            # endpos: 'ʻ' is a word character, and cutting the search off before it
+            # would let the lookahead accept e.g. '12' in '12ʻ' as a reference.
+            special = _RAW_SPECIAL.search(raw, i + 1)
+            if special:
+                j, end = special.start(), special.end()
+            else:
+                j = end = n
+            ref = _REFERENCE.search(raw, i + 1, end)
+            if ref:
+                j = ref.start()
             push('text', raw[i:j])
             i = j
 
@@ -766,21 +950,21 @@ class FixedDocxParser:
             return False
 
         # References like "EL 26", "JL 20.7.44", "[LTN]", "prs 24/2"
-        if re.match(r'^[A-Z]{1,3}\s+\d+', text) or re.match(r'^\[?[A-Z]{2,5}\]?;?$', text):
+        if _CAPS_REFERENCE.match(text) or _SIGLUM.match(text):
             return False
-        if re.match(r'^(prs|cf\.)\s+\d+', text):
+        if _PRS_CF_REFERENCE.match(text):
             return False
 
         # Pure numbers, dates, page references
-        if re.match(r'^[\d;/\s\[\]]+$', text):
+        if _NUMBERS_ONLY.match(text):
             return False
 
         # Meta-notes (Russian only)
-        if re.match(r'^[А-Яа-я\s]+$', text):
+        if _CYRILLIC_ONLY.match(text):
             return False
 
         # Must contain at least one lowercase letter (German/English have lowercase)
-        if not re.search(r'[a-zäöüß]', text):
+        if not _LOWERCASE_LETTER.search(text):
             return False
 
         # Minimum length after other filters (allow shorter translations now)
@@ -804,11 +988,10 @@ class FixedDocxParser:
         text = text.strip()
 
         # AGENT 1 FIX 2: Strip leading numbered list markers
-        text_without_numbering = re.sub(r'^\d+\)\s*', '', text)
+        text_without_numbering = _LIST_NUMBER_PREFIX.sub('', text)
 
-        # Turoyo-specific characters that rarely appear in German/English
-        turoyo_chars = 'ʔʕḏṯṣṭḥǧġšžəāēīū'
-        turoyo_char_count = sum(1 for c in text_without_numbering if c in turoyo_chars)
+        # One C-level str.count per marker char instead of a per-char Python loop
+        turoyo_char_count = sum(map(text_without_numbering.count, _TUROYO_MARKER_CHARS))
 
         # If has significant Turoyo characters, likely Turoyo
         if len(text_without_numbering) > 0 and (turoyo_char_count / len(text_without_numbering)) > 0.15:
@@ -837,19 +1020,14 @@ class FixedDocxParser:
         """
         text = text.strip()
 
-        # AGENT 1 FIX 3: Add \u0300-\u036F (combining) and \u00C0-\u017F (Latin Extended for é, í, à)
-        turoyo_with_diacritics = r'[a-zāēīūəǝʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ\u0300-\u036F\u00C0-\u017F\s\-=]'
-
-        simple_form_with_ref = rf'^{turoyo_with_diacritics}+;\s*\d+\s*;\s*$'
-        if re.match(simple_form_with_ref, text, re.IGNORECASE):
+        # AGENT 1 FIX 3: _FORM_CHARS adds \u0300-\u036F (combining) and \u00C0-\u017F (Latin Extended for é, í, à)
+        if _FORM_WITH_REF.match(text):
             return True
 
-        variant_pattern = rf'^{turoyo_with_diacritics}+(?:;\s*{turoyo_with_diacritics}+)+;\s*\d+\s*;\s*$'
-        if re.match(variant_pattern, text, re.IGNORECASE):
+        if _FORM_VARIANTS_WITH_REF.match(text):
             return True
 
-        simple_form_with_parens = rf'^{turoyo_with_diacritics}+!?\s*\([^\)]+\)$'
-        if re.match(simple_form_with_parens, text, re.IGNORECASE):
+        if _FORM_WITH_PARENS.match(text):
             return True
 
         return False
@@ -869,38 +1047,7 @@ class FixedDocxParser:
 
         Recovers: 4 + 2 = 6 of 26 empty Turoyo cases
         """
-        text = text.strip()
-
-        # Case-SENSITIVE patterns (for proper names starting with uppercase)
-        case_sensitive_patterns = [
-            r'^[A-Z][a-z]+\s+p\.c\.',         # Personal communication (John p.c.)
-            r'^[A-Z][a-z]+_[A-Z]',            # Name_Code (Smith_J)
-            r'^[A-Z][a-z]+-[A-Z]',            # Name-Code (Xori-Caziz)
-            r'^[A-Z][a-z]+\s+\d{1,2},\s*\d{4}',  # January 23, 2024
-        ]
-
-        # Case-INSENSITIVE patterns (work regardless of case)
-        case_insensitive_patterns = [
-            r'^\d{4}_\d{2}_\d{2}',            # Date format (2024_01_23)
-            r'^\([A-Za-z\s]+\s+\d+',          # (Text number
-            r'^\[\d{1,2}:\d{2}\s*[AP]M,\s*\d{1,2}/\d{1,2}/\d{4}\]',  # [8:30 AM, 1/23/2024]
-            r'^\d{1,2}:\d{2}\s*[AP]M',        # 8:30 AM
-            r'^\(See\s+[a-zʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ]+',  # (See root)
-            r'^\(Compare\s+',                 # (Compare ...)
-            r'^\(cf\.\s+[a-zʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓ]+\s*\d*\)',  # (cf. root 1)
-        ]
-
-        # Check case-sensitive patterns first (no IGNORECASE flag)
-        for pattern in case_sensitive_patterns:
-            if re.match(pattern, text):
-                return True
-
-        # Check case-insensitive patterns
-        for pattern in case_insensitive_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return True
-
-        return False
+        return _METADATA_LINE.match(text.strip()) is not None
 
     def extract_variant_forms(self, text):
         """Extract variant forms like 'tukilo; tawkilo; tawkolo; 721;' or 'mbarzaqqe l-am=maye; 770;'"""
@@ -910,11 +1057,11 @@ class FixedDocxParser:
         references = []
 
         for part in parts:
-            if re.match(r'^\d+$', part):
+            if _DIGITS.match(part):
                 references.append(part)
             elif len(part) > 1:
-                turoyo_ratio = sum(1 for c in part if c in 'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou-=')
-                if turoyo_ratio >= 2 or self.is_likely_turoyo(part):
+                # One regex search for a second form character instead of counting them all
+                if _VARIANT_FORM_CHAR_PAIR.search(part) or self.is_likely_turoyo(part):
                     forms.append(part)
 
         return forms, references
@@ -934,29 +1081,31 @@ class FixedDocxParser:
         if not examples or len(examples) < 2:
             return examples
 
+        last = len(examples) - 1
+
+        # A merge can only start at an example without translations
+        if all(example.get('translations') for example in islice(examples, last)):
+            return examples
+
         merged = []
         i = 0
 
-        while i < len(examples):
+        while i <= last:
             current = examples[i]
 
             # Check if current has Turoyo but no translations
             # and next has translations but no Turoyo
-            if (i + 1 < len(examples) and
-                current.get('turoyo', '').strip() and
-                not current.get('translations') and
-                not examples[i + 1].get('turoyo', '').strip() and
-                examples[i + 1].get('translations')):
-
-                # Merge: take Turoyo from current, translations from next
-                merged_example = {
-                    'turoyo': current['turoyo'],
-                    'translations': examples[i + 1]['translations'],
-                    'references': current.get('references', []) + examples[i + 1].get('references', [])
-                }
-                merged.append(merged_example)
-                i += 2  # Skip both examples
-                continue
+            if i < last and not current.get('translations') and current.get('turoyo', '').strip():
+                following = examples[i + 1]
+                if following.get('translations') and not following.get('turoyo', '').strip():
+                    # Merge: take Turoyo from current, translations from next
+                    merged.append({
+                        'turoyo': current['turoyo'],
+                        'translations': following['translations'],
+                        'references': current.get('references', []) + following.get('references', [])
+                    })
+                    i += 2  # Skip both examples
+                    continue
 
             # No merge - keep current example
             merged.append(current)
@@ -1157,11 +1306,7 @@ class FixedDocxParser:
         Extract reference strings from tokens exactly as tokenized.
         The tokenizer already captures full references like "LuF 286/44" or "147".
         """
-        refs = []
-        for token in tokens:
-            if token.get('kind') == 'ref':
-                refs.append(token.get('value', '').strip())
-        return refs
+        return [token['value'].strip() for token in tokens if token['kind'] == 'ref']
 
     def parse_table_cell(self, cell):
         """
@@ -1181,14 +1326,14 @@ class FixedDocxParser:
                 continue
 
             # Skip reference-only lines like "611;" or "LB 89;"
-            if re.match(r'^[\d\s;/,]+$', full_text):
+            if _REFERENCE_ONLY_LINE.match(full_text):
                 continue
 
             # Split paragraph into numbered items when present (e.g., "1) ... 2) ...")
             # Find all occurrences of "N) " and build segments
             # BUGFIX: Only match 1-2 digit numbers (not years like 2018 in "(Notes 2018)")
             indices = []
-            for m in re.finditer(r'(?:^|\s)(\d{1,2})\)\s', para_text):
+            for m in _ITEM_NUMBER.finditer(para_text):
                 # Start at the digit position (exclude leading whitespace)
                 indices.append(m.start(1))
             if not indices:
@@ -1205,16 +1350,21 @@ class FixedDocxParser:
 
                 # Tokenize by content only (don't rely on italics)
                 tokens = self._split_raw_to_tokens(item_plain)
-                # Convert plain text tokens to turoyo by default
-                for tkn in tokens:
-                    if tkn.get('kind') == 'text':
-                        tkn['kind'] = 'turoyo'
 
-                # Extract derived fields for search/filter
-                translations = [
-                    self.normalize_whitespace(tok['value'].strip('\u02bb\u02bc"\u2018\u2019\u201c\u201d\''))
-                    for tok in tokens if tok['kind'] == 'translation'
-                ]
+                # One pass over the tokens: convert plain text tokens to turoyo
+                # by default and collect the derived fields for search/filter
+                translations = []
+                turoyo_parts = []
+                for tkn in tokens:
+                    kind = tkn['kind']
+                    if kind == 'text':
+                        tkn['kind'] = kind = 'turoyo'
+                    if kind == 'turoyo':
+                        turoyo_parts.append(tkn['value'])
+                    elif kind == 'translation':
+                        translations.append(self.normalize_whitespace(
+                            tkn['value'].strip('\u02bb\u02bc"\u2018\u2019\u201c\u201d\'')
+                        ))
 
                 # no italic-based fallback; turoyo will be formed from non-translation tokens
 
@@ -1222,9 +1372,7 @@ class FixedDocxParser:
                 references = self._extract_reference_groups(tokens)
 
                 # Join all turoyo tokens for a searchable turoyo_text snapshot
-                turoyo_text = self.normalize_whitespace(''.join(
-                    (tok['value'] for tok in tokens if tok['kind'] == 'turoyo')
-                )) if tokens else ''
+                turoyo_text = self.normalize_whitespace(''.join(turoyo_parts))
 
                 if turoyo_text or translations or tokens:
                     examples.append({
@@ -1232,7 +1380,7 @@ class FixedDocxParser:
                         'translations': translations,
                         'references': references if references else [],
                         'tokens': tokens,
-                        'text': self.normalize_whitespace(item_plain),
+                        'text': item_plain_norm,
                     })
 
         # Merge split Turoyo/translation pairs
@@ -1261,20 +1409,21 @@ class FixedDocxParser:
         if not text or len(text) < 10:
             return False
 
-        has_verb_form = any(form in text for form in verb_forms if form)
-        has_quotation = bool(re.search(r'[ʻʼ\'''"""\"]', text))
+        # Every rule below needs a quotation, so check it before scanning
+        # the text once per verb form
+        if not _QUOTATION_MARK.search(text):
+            return False
 
-        if has_verb_form and has_quotation:
+        if any(form in text for form in verb_forms if form):
             return True
 
-        turoyo_chars = r'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝ'
-        starts_with_turoyo = bool(re.match(rf'^[{turoyo_chars}]', text, re.UNICODE))
+        starts_with_turoyo = bool(_IDIOM_TUROYO_START.match(text))
 
-        if starts_with_turoyo and has_quotation and len(text) > 30:
+        if starts_with_turoyo and len(text) > 30:
             return True
 
-        turoyo_sequences = re.findall(rf'[{turoyo_chars}]+', text, re.UNICODE)
-        if len(turoyo_sequences) >= 3 and has_quotation:
+        turoyo_sequences = _IDIOM_TUROYO_RUN.findall(text)
+        if len(turoyo_sequences) >= 3:
             return True
 
         return False
@@ -1288,9 +1437,11 @@ class FixedDocxParser:
         """
         text = text.strip()
 
-        quotes = re.findall(r'[ʻʼ\'''"""\"]([^ʻʼ\'''""\"]+)[ʻʼ\'''""\"]', text)
+        # First quoted span is the meaning, second the example translation
+        quotes = _QUOTED_PHRASE.finditer(text)
+        first = next(quotes, None)
 
-        if not quotes:
+        if first is None:
             return {
                 'phrase': '',
                 'meaning': '',
@@ -1301,42 +1452,30 @@ class FixedDocxParser:
                 }]
             }
 
-        meaning = quotes[0] if quotes else ''
+        meaning = first.group(1)
 
-        first_quote_pos = text.find(f"'{meaning}'") if meaning else 0
-        if first_quote_pos < 0:
-            first_quote_pos = text.find(f"ʻ{meaning}ʼ")
-        if first_quote_pos < 0:
-            first_quote_pos = text.find(f'"{meaning}"')
+        phrase = text[:first.start()].strip().rstrip(':').strip()
 
-        phrase = text[:first_quote_pos].strip() if first_quote_pos > 0 else ''
-        phrase = re.sub(r':+$', '', phrase).strip()
+        example_text = text[first.end():].strip()
+        if example_text.startswith(':'):
+            example_text = example_text[1:].lstrip()
 
-        example_start = first_quote_pos + len(meaning) + 2 if first_quote_pos >= 0 else 0
-        example_text = text[example_start:].strip()
-        example_text = re.sub(r'^:\s*', '', example_text)
-
-        turoyo_part = ''
         translation_part = ''
+        turoyo_part = example_text
 
-        if len(quotes) > 1:
-            translation_part = quotes[1]
-
-            second_quote_pos = example_text.find(f"'{translation_part}'")
-            if second_quote_pos < 0:
-                second_quote_pos = example_text.find(f"ʻ{translation_part}ʼ")
-            if second_quote_pos < 0:
-                second_quote_pos = example_text.find(f'"{translation_part}"')
+        second = next(quotes, None)
+        if second is not None:
+            translation_part = second.group(1)
 
-            if second_quote_pos > 0:
-                turoyo_part = example_text[:second_quote_pos].strip()
-            else:
-                turoyo_part = example_text
-        else:
-            turoyo_part = example_text
+            before_translation = text[first.end():second.start()].lstrip()
+            if before_translation.startswith(':'):
+                before_translation = before_translation[1:]
+            before_translation = before_translation.strip()
+            if before_translation:
+                turoyo_part = before_translation
 
         reference = None
-        ref_match = re.search(r'\b(\d+/\d+|\d+:\d+)\b', text)
+        ref_match = _IDIOM_REFERENCE.search(text)
         if ref_match:
             reference = ref_match.group(1)
 
@@ -1370,25 +1509,24 @@ class FixedDocxParser:
 
         idiom_texts = []
 
+        # No is_in_table() check: pending_idiom_paras only ever holds body-level
+        # paragraphs from the element map, never table cell paragraphs
         for para in paragraphs:
-            if self.is_in_table(para):
-                continue
-
-            text = self.normalize_whitespace(para.text.strip())
+            text = self.normalize_whitespace(self.paragraph_text(para).strip())
 
             if not text or len(text) < 3:
                 continue
 
             # Skip headers
-            if re.match(r'^(Detransitive|Idiomatic phrases?|Idioms?|Examples?|Collocations?):?$', text, re.IGNORECASE):
+            if _NOT_IDIOM_HEADER.match(text):
                 continue
 
             # Skip "(Detrans.)" markers
-            if re.match(r'^\(Detrans\.?\)', text, re.IGNORECASE):
+            if _DETRANS_MARKER.match(text):
                 continue
 
             # Skip numbered meaning lists (not idioms)
-            if re.match(r'^\d+\)\s+.+;\s*\d+\)\s+.+;', text):
+            if _NUMBERED_MEANINGS.match(text):
                 continue
 
             idiom_texts.append(text)
@@ -1445,9 +1583,7 @@ class FixedDocxParser:
         """
         segments = []
 
-        verb_form_pattern = r's[əo]mle[/]soy[əo]m|soy[əo]m[/]s[əo]mle'
-
-        matches = list(re.finditer(verb_form_pattern, text))
+        matches = list(_IDIOM_VERB_FORM.finditer(text))
 
         if len(matches) <= 1:
             return [text]
@@ -1460,10 +1596,10 @@ class FixedDocxParser:
 
             look_back = text[max(0, start_pos - 10):start_pos]
 
-            if re.search(r'[;][\s]*$', look_back):
+            if _TRAILING_SEMICOLON.search(look_back):
                 segments.append(text[:start_pos].strip())
                 text = text[start_pos:]
-                matches = list(re.finditer(verb_form_pattern, text))
+                matches = list(_IDIOM_VERB_FORM.finditer(text))
 
         if text:
             segments.append(text.strip())
@@ -1493,10 +1629,7 @@ class FixedDocxParser:
         if not text:
             return None
 
-        open_quotes = r'[ʻ\u2018\u201c\']'
-        close_quotes = r'[ʼ\u2019\u201d\']'
-
-        first_quote_match = re.search(rf'{open_quotes}([^ʻʼ\u2018\u2019\u201c\u201d\']+?){close_quotes}', text)
+        first_quote_match = _IDIOM_MEANING.search(text)
 
         if not first_quote_match:
             return {
@@ -1511,10 +1644,10 @@ class FixedDocxParser:
         quote_end = first_quote_match.end()
 
         phrase = text[:quote_start].strip()
-        phrase = re.sub(r'[:;]+$', '', phrase).strip()
+        phrase = _TRAILING_SEPARATORS.sub('', phrase).strip()
 
         examples_text = text[quote_end:].strip()
-        examples_text = re.sub(r'^[:;]+\s*', '', examples_text).strip()
+        examples_text = _LEADING_SEPARATORS.sub('', examples_text).strip()
 
         examples = self._parse_idiom_examples(examples_text)
 
@@ -1682,25 +1815,35 @@ class FixedDocxParser:
         self.pending_idiom_paras = []
         self.in_idioms_section = False
         self.consumed_para_indices = set()
+        self.run_formats = {}
+        self.style_names = {}
+        self.para_texts = {}
+
+        # Build element map. doc.paragraphs / doc.tables rebuild every wrapper on
+        # each access, so they are indexed by element once instead of scanned
+        # per body element.
+        paragraphs_by_element = {para._element: para for para in doc.paragraphs}
+        tables_by_element = {table._element: table for table in doc.tables}
 
-        # Build element map
         elements = []
         for el in doc.element.body:
             tag = el.tag.split('}')[1] if '}' in el.tag else el.tag
 
             if tag == 'p':
-                for para in doc.paragraphs:
-                    if para._element == el:
-                        elements.append(('para', para))
-                        break
+                para = paragraphs_by_element.get(el)
+                if para is not None:
+                    elements.append(('para', para))
             elif tag == 'tbl':
-                for table in doc.tables:
-                    if table._element == el:
-                        elements.append(('table', table))
-                        break
+                table = tables_by_element.get(el)
+                if table is not None:
+                    elements.append(('table', table))
 
         current_verb = None
         current_stem = None
+        # The current verb's first Detransitive stem and all of its stems' forms,
+        # tracked as stems are appended
+        detransitive_stem = None
+        verb_forms = []
 
         for idx, (elem_type, elem) in enumerate(elements):
             if elem_type == 'para':
@@ -1713,24 +1856,18 @@ class FixedDocxParser:
                 for j in range(idx + 1, min(idx + 4, len(elements))):
                     if elements[j][0] == 'para':
                         candidate = elements[j][1]
-                        if candidate.text.strip():
+                        if self.paragraph_text(candidate).strip():
                             next_para = candidate
                             break
 
                 is_root = self.is_root_paragraph(para, next_para)
-                is_root_strict = (
-                    para.text.strip() and
-                    any(r.italic for r in para.runs) and
-                    11.0 in [r.font.size.pt for r in para.runs if r.font.size]
-                )
 
                 if is_root:
+                    is_root_strict = all(self.run_formatting(para))
+
                     if current_verb:
                         if self.pending_idiom_paras:
-                            all_verb_forms = []
-                            for stem in current_verb.get('stems', []):
-                                all_verb_forms.extend(stem.get('forms', []))
-                            idioms = self.extract_idioms(self.pending_idiom_paras, all_verb_forms, self.in_idioms_section)
+                            idioms = self.extract_idioms(self.pending_idiom_paras, verb_forms, self.in_idioms_section)
                             if idioms:
                                 current_verb['idioms'] = idioms
                                 self.stats['idioms_extracted'] = self.stats.get('idioms_extracted', 0) + len(idioms)
@@ -1742,8 +1879,8 @@ class FixedDocxParser:
                     self.in_idioms_section = False
 
                     # Pass next paragraph text for multi-paragraph etymology support
-                    next_para_text = next_para.text if next_para else None
-                    root, etymology, root_gloss, cross_reference = self.extract_root_and_etymology(para.text, next_para_text)
+                    next_para_text = self.paragraph_text(next_para) if next_para else None
+                    root, etymology, root_gloss, cross_reference = self.extract_root_and_etymology(self.paragraph_text(para), next_para_text)
                     if root:
                         current_verb = {
                             'root': root,
@@ -1753,9 +1890,11 @@ class FixedDocxParser:
                             'stems': [],
                             'idioms': None,
                         }
+                        detransitive_stem = None
+                        verb_forms = []
                         
                         # Assign uncertain flag to etymology
-                        if '???' in para.text:
+                        if '???' in self.paragraph_text(para):
                             current_verb['etymology']['uncertain'] = True
                         current_stem = None
                         self.pending_idiom_paras = []
@@ -1770,7 +1909,7 @@ class FixedDocxParser:
                     # Look ahead a few elements, skipping empty paragraphs, to see if a table follows
                     for j in range(idx + 1, min(idx + 4, len(elements))):
                         et, el = elements[j]
-                        if et == 'para' and el.text.strip():
+                        if et == 'para' and self.paragraph_text(el).strip():
                             # Stop at first non-empty paragraph
                             break
                         if et == 'table':
@@ -1778,24 +1917,17 @@ class FixedDocxParser:
                             break
 
                     if self.is_stem_header(para, next_elem_is_table):
-                        para_text = para.text.strip()
+                        para_text = self.paragraph_text(para).strip()
 
                         # BUGFIX: Handle special stem types (Detransitive, Action Noun, Infinitiv)
                         # Use regex for more robust matching (case insensitive, optional colon)
-                        if re.match(r'^(Detransitive|Action Noun|Infinitiv):?$', para_text, re.IGNORECASE):
+                        special_stem = _SPECIAL_STEM_HEADER.match(para_text)
+                        if special_stem:
                             # Normalize the stem name
-                            if re.match(r'^Detransitive', para_text, re.IGNORECASE):
-                                para_text = 'Detransitive'
-                            elif re.match(r'^Action Noun', para_text, re.IGNORECASE):
-                                para_text = 'Action Noun'
-                            elif re.match(r'^Infinitiv', para_text, re.IGNORECASE):
-                                para_text = 'Infinitiv'
+                            para_text = _SPECIAL_STEM_NAMES.get(special_stem.group(1)[0].lower(), 'Infinitiv')
                             # BUGFIX V2.1.7: Extract idioms before starting new stem
                             if self.in_idioms_section and self.pending_idiom_paras:
-                                all_verb_forms = []
-                                for stem in current_verb.get('stems', []):
-                                    all_verb_forms.extend(stem.get('forms', []))
-                                idioms = self.extract_idioms(self.pending_idiom_paras, all_verb_forms, self.in_idioms_section)
+                                idioms = self.extract_idioms(self.pending_idiom_paras, verb_forms, self.in_idioms_section)
                                 if idioms:
                                     current_verb['idioms'] = idioms
                                     self.stats['idioms_extracted'] = self.stats.get('idioms_extracted', 0) + len(idioms)
@@ -1805,12 +1937,7 @@ class FixedDocxParser:
 
                             # DETRANSITIVE FIX: Check if a Detransitive stem already exists
                             # If so, reuse it instead of creating a new one
-                            existing_stem = None
-                            if para_text == 'Detransitive' and current_verb:
-                                for stem in current_verb['stems']:
-                                    if stem['stem'] == 'Detransitive':
-                                        existing_stem = stem
-                                        break
+                            existing_stem = detransitive_stem if para_text == 'Detransitive' else None
 
                             if existing_stem:
                                 # Reuse existing Detransitive stem (already has forms from "I:" line)
@@ -1827,7 +1954,7 @@ class FixedDocxParser:
                                         break
 
                                     next_p = elements[j][1]
-                                    next_text = next_p.text.strip()
+                                    next_text = self.paragraph_text(next_p).strip()
 
                                     if not next_text:
                                         continue
@@ -1839,11 +1966,7 @@ class FixedDocxParser:
                                     # First non-empty para after header: check if it's forms
                                     if not forms:
                                         # Pattern: "nqil/mənqəl" or "nqolo" (Turoyo forms)
-                                        # Include both special and basic ASCII vowels
-                                        turoyo_chars = r'ʔʕbčdfgġǧhḥklmnpqrsṣštṭvwxyzžḏṯẓāēīūəǝaeiou\u0300-\u036F'
-                                        forms_pattern = rf'^[{turoyo_chars}]+(?:/[{turoyo_chars}]+)*$'
-
-                                        if re.match(forms_pattern, next_text):
+                                        if _SPECIAL_STEM_FORMS.match(next_text):
                                             # Extract forms (split by /)
                                             forms = [f.strip() for f in next_text.split('/') if f.strip()]
                                             continue
@@ -1867,7 +1990,7 @@ class FixedDocxParser:
                                     for j in range(idx + 1, min(idx + 4, len(elements))):
                                         if elements[j][0] == 'para':
                                             p = elements[j][1]
-                                            if label_gloss in p.text:
+                                            if label_gloss in self.paragraph_text(p):
                                                 has_italic = any(r.italic for r in p.runs if r.text.strip())
                                                 break
 
@@ -1880,20 +2003,19 @@ class FixedDocxParser:
 
                                 if current_verb is not None:
                                     current_verb['stems'].append(current_stem)
+                                    verb_forms.extend(current_stem['forms'])
                                     self.stats['stems_parsed'] += 1
                                     if para_text == 'Detransitive':
+                                        detransitive_stem = current_stem
                                         self.stats['detransitive_entries'] += 1
 
                         else:
                             # Regular stem (I, II, Pa., Af., etc.)
-                            stem_num, forms, gloss_text = self.extract_stem_info(para.text)
+                            stem_num, forms, gloss_text = self.extract_stem_info(self.paragraph_text(para))
                             if stem_num and current_verb is not None:
                                 # BUGFIX V2.1.7: Extract idioms before starting new stem
                                 if self.in_idioms_section and self.pending_idiom_paras:
-                                    all_verb_forms = []
-                                    for stem in current_verb.get('stems', []):
-                                        all_verb_forms.extend(stem.get('forms', []))
-                                    idioms = self.extract_idioms(self.pending_idiom_paras, all_verb_forms, self.in_idioms_section)
+                                    idioms = self.extract_idioms(self.pending_idiom_paras, verb_forms, self.in_idioms_section)
                                     if idioms:
                                         current_verb['idioms'] = idioms
                                         self.stats['idioms_extracted'] = self.stats.get('idioms_extracted', 0) + len(idioms)
@@ -1910,7 +2032,7 @@ class FixedDocxParser:
                                 for j in range(idx + 1, min(idx + 10, len(elements))):
                                     if elements[j][0] == 'para':
                                         next_p = elements[j][1]
-                                        next_text = next_p.text.strip()
+                                        next_text = self.paragraph_text(next_p).strip()
 
                                         if not next_text:
                                             continue  # Skip empty paragraphs
@@ -1952,7 +2074,7 @@ class FixedDocxParser:
                                     for j in range(idx + 1, min(idx + 3, len(elements))):
                                         if elements[j][0] == 'para':
                                             next_p = elements[j][1]
-                                            next_text = next_p.text.strip()
+                                            next_text = self.paragraph_text(next_p).strip()
 
                                             # Skip empty paragraphs
                                             if not next_text:
@@ -1963,7 +2085,7 @@ class FixedDocxParser:
                                                 break
 
                                             # Stop if next para is idioms header
-                                            if re.match(r'^(Idiomatic phrases?|Idioms?):?$', next_text, re.IGNORECASE):
+                                            if _IDIOMS_HEADER.match(next_text):
                                                 break
 
                                             # This paragraph is likely a separate gloss
@@ -1983,15 +2105,18 @@ class FixedDocxParser:
                                             break
 
                                 current_verb['stems'].append(current_stem)
+                                verb_forms.extend(current_stem['forms'])
                                 self.stats['stems_parsed'] += 1
 
                                 if actual_stem_type == 'Detransitive':
+                                    if detransitive_stem is None:
+                                        detransitive_stem = current_stem
                                     self.stats['detransitive_entries'] = self.stats.get('detransitive_entries', 0) + 1
 
                     elif current_verb is not None and current_verb.get('stems'):
                         # CRITICAL FIX: Detect "Idiomatic Phrases" header and set flag
-                        para_text = para.text.strip()
-                        if re.match(r'^(Idiomatic phrases?|Idioms?):?$', para_text, re.IGNORECASE):
+                        para_text = self.paragraph_text(para).strip()
+                        if _IDIOMS_HEADER.match(para_text):
                             self.in_idioms_section = True
 
                         # BUGFIX V2.1.7: Only append paragraphs AFTER idioms header is found
@@ -2006,7 +2131,8 @@ class FixedDocxParser:
                 if current_stem is not None and table.rows:
                     for row in table.rows:
                         if len(row.cells) >= 2:
-                            conj_type = row.cells[0].text.strip()
+                            # Interned: the same few conjugation names key every stem's dict
+                            conj_type = sys.intern(row.cells[0].text.strip())
                             examples_cell = row.cells[1]
 
                             examples = self.parse_table_cell(examples_cell)
@@ -2020,10 +2146,7 @@ class FixedDocxParser:
 
         if current_verb:
             if self.pending_idiom_paras:
-                all_verb_forms = []
-                for stem in current_verb.get('stems', []):
-                    all_verb_forms.extend(stem.get('forms', []))
-                idioms = self.extract_idioms(self.pending_idiom_paras, all_verb_forms, self.in_idioms_section)
+                idioms = self.extract_idioms(self.pending_idiom_paras, verb_forms, self.in_idioms_section)
                 if idioms:
                     current_verb['idioms'] = idioms
                     self.stats['idioms_extracted'] = self.stats.get('idioms_extracted', 0) + len(idioms)
@@ -2031,6 +2154,10 @@ class FixedDocxParser:
             self.verbs.append(current_verb)
             self.stats['verbs_parsed'] += 1
 
+        self.print_parse_totals()
+
+    def print_parse_totals(self):
+        """Running totals printed after each parsed file"""
         print(f"   ✓ {self.stats['verbs_parsed']} verbs, {self.stats['stems_parsed']} stems, {self.stats['examples_parsed']} examples")
         if self.stats.get('idioms_extracted'):
             print(f"   💬 {self.stats['idioms_extracted']} idiomatic expressions extracted")
@@ -2046,7 +2173,9 @@ class FixedDocxParser:
 
         root_groups = defaultdict(list)
         for idx, verb in enumerate(self.verbs):
-            base_root = re.sub(r'\s+\d+$', '', verb['root'])
+            root = verb['root']
+            # Only roots ending in a digit can carry a homonym number
+            base_root = _HOMONYM_NUMBER.sub('', root) if root and root[-1].isdigit() else root
             root_groups[base_root].append((idx, verb))
 
         numbered_count = 0
@@ -2067,35 +2196,18 @@ class FixedDocxParser:
                 continue
 
             # Get etymology signatures
-            etymologies = []
-            for idx, verb in entries:
-                etym = verb.get('etymology')
-                if etym:
-                    if 'etymons' in etym and etym['etymons']:
-                        first_etymon = etym['etymons'][0]
-                        sig = (
-                            first_etymon.get('source', ''),
-                            first_etymon.get('source_root', ''),
-                            first_etymon.get('notes', ''),
-                            first_etymon.get('raw', ''),
-                            first_etymon.get('reference', '')
-                        )
-                    else:
-                        sig = None
-                else:
-                    sig = None
-                etymologies.append((idx, sig))
-
-            unique_etyms = set(sig for _, sig in etymologies)
+            signatures = [_etymology_signature(verb.get('etymology')) for _, verb in entries]
+            first_signature = signatures[0]
+            if all(sig == first_signature for sig in signatures):
+                continue
 
             # Only auto-number if multiple different etymologies AND no existing DOCX numbers
-            if len(unique_etyms) > 1:
-                print(f"   ℹ️  Auto-numbering '{root}' with {len(unique_etyms)} different etymologies")
-                for entry_num, (idx, sig) in enumerate(etymologies, 1):
-                    old_root = self.verbs[idx]['root']
-                    self.verbs[idx]['root'] = f"{root} {entry_num}"
-                    print(f"      {old_root} → {self.verbs[idx]['root']}")
-                numbered_count += len(entries)
+            print(f"   ℹ️  Auto-numbering '{root}' with {len(set(signatures))} different etymologies")
+            for entry_num, (idx, _) in enumerate(entries, 1):
+                old_root = self.verbs[idx]['root']
+                self.verbs[idx]['root'] = f"{root} {entry_num}"
+                print(f"      {old_root} → {self.verbs[idx]['root']}")
+            numbered_count += len(entries)
 
         if preserved_count > 0:
             print(f"   ✅ Preserved {preserved_count} DOCX-numbered homonyms")
@@ -2135,7 +2247,8 @@ class FixedDocxParser:
             self.stats['duplicate_roots_renamed'] = renamed
             print(f"   ✅ Renamed {renamed} duplicate roots to avoid overwriting files")
 
-    def parse_all_files(self, docx_dir):
+    def parse_all_files(self, docx_dir, workers=None):
+        """Parse every DOCX in docx_dir (workers: process count, default os.cpu_count())"""
         print("=" * 80)
         print("DOCX PARSER V2 - WITH CONTEXTUAL VALIDATION")
         print("=" * 80)
@@ -2143,8 +2256,18 @@ class FixedDocxParser:
         docx_files = sorted(Path(docx_dir).glob('*.docx'))
         print(f"\n🔄 Parsing {len(docx_files)} files...")
 
-        for docx_file in docx_files:
-            self.parse_document_with_tables(docx_file)
+        # Per-file parser state is reset at the start of each document, so the
+        # files are parsed in worker processes and merged here in file order,
+        # printing the same running totals as a sequential run
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_docx_file, docx_files)
+            for docx_file, (verbs, stats, contextual_roots) in zip(docx_files, results):
+                print(f"\n📖 {docx_file.name}")
+                self.verbs.extend(verbs)
+                for key, value in stats.items():
+                    self.stats[key] += value
+                self.contextual_roots.extend(contextual_roots)
+                self.print_parse_totals()
 
         # Add homonym numbering AFTER parsing all files
         self.add_homonym_numbers()
@@ -2157,23 +2280,20 @@ class FixedDocxParser:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         total_examples = sum(
-            sum(len(conj_data) for conj_data in stem['conjugations'].values())
+            sum(map(len, stem['conjugations'].values()))
             for verb in self.verbs
             for stem in verb['stems']
         )
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'verbs': self.verbs,
-                'metadata': {
-                    'total_verbs': len(self.verbs),
-                    'total_stems': self.stats['stems_parsed'],
-                    'total_examples': total_examples,
-                    'homonyms_numbered': self.stats.get('homonyms_numbered', 0),
-                    'contextual_roots': self.stats.get('contextual_roots', 0),
-                    'parser_version': 'docx-v2-fixed-with-contextual'
-                }
-            }, f, ensure_ascii=False, indent=2)
+        metadata = {
+            'total_verbs': len(self.verbs),
+            'total_stems': self.stats['stems_parsed'],
+            'total_examples': total_examples,
+            'homonyms_numbered': self.stats.get('homonyms_numbered', 0),
+            'contextual_roots': self.stats.get('contextual_roots', 0),
+            'parser_version': 'docx-v2-fixed-with-contextual'
+        }
+        write_verbs_json(output_file, self.verbs, metadata)
 
         print(f"\n💾 Saved: {output_file}")
         print(f"   📊 {len(self.verbs)} verbs, {self.stats['stems_parsed']} stems, {total_examples} examples")
@@ -2197,11 +2317,19 @@ class FixedDocxParser:
             filename = f"{root}.json"
             filepath = output_path / filename
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(verb, f, ensure_ascii=False, indent=2)
+            write_json(filepath, verb)
 
         print(f"✅ Created {len(self.verbs)} individual verb files in {output_path}")
 
+def _parse_docx_file(docx_path):
+    """Worker for parse_all_files: parse one file, return (verbs, stats, contextual_roots)"""
+    parser = FixedDocxParser()
+    # The parent prints the file header and running totals
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.parse_document_with_tables(docx_path)
+    return parser.verbs, dict(parser.stats), parser.contextual_roots
+
+
 def main():
     parser = FixedDocxParser()
     parser.parse_all_files('.devkit/new-source-docx')
@@ -2220,8 +2348,10 @@ def main():
 
     if parser.contextual_roots:
         print(f"\n✨ Recovered verbs via contextual validation:")
+        # First verb per root, as a linear search would find it
+        verbs_by_root = {v['root']: v for v in reversed(parser.verbs)}
         for root in parser.contextual_roots[:15]:
-            verb = next((v for v in parser.verbs if v['root'] == root), None)
+            verb = verbs_by_root.get(root)
             if verb:
                 print(f"   {root}: {len(verb['stems'])} stems")
         if len(parser.contextual_roots) > 15:
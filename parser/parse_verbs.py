@@ -18,12 +18,181 @@ Last Updated: 2025-10-16
 """
 
 import re
-import json
+import sys
 import subprocess
 import html
+import mmap
+import os
 from pathlib import Path
-from collections import defaultdict
-from bs4 import BeautifulSoup, Tag, NavigableString
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from json_output import write_json, write_verbs_json
+
+# Letters of the transcription alphabet (letter headings and verb roots)
+ROOT_CHARS = 'ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzžḏṯẓāēīūə'
+# Root letters that cannot occur in a German gloss word
+_ROOT_SPECIAL_CHARS = frozenset('ʔʕġǧḥṣṭḏṯẓčšžāēīūə')
+
+# Letter section heading, matched on the raw UTF-8 bytes of the source file (the
+# letters are multi-byte, so they are an alternation rather than a character class)
+_LETTER_HEADER = re.compile(
+    rb'<h1[^>]*>(?:\s|\xc2\xa0)*<span[^>]*>(?:&shy;)?('
+    + b'|'.join(re.escape(c.encode('utf-8')) for c in ROOT_CHARS)
+    + rb')</span></h1>'
+)
+
+# Root paragraph that opens each entry
+_ROOT_PARAGRAPH = re.compile(rf'<p[^>]*class="western"[^>]*>(?:<font[^>]*>)*(?:<i[^>]*>)?<span[^>]*>([{ROOT_CHARS}]{{2,6}})(?:\s*\d+)?[^<]*</span>')
+_ROOT_TRAILER = re.compile(r'^[.:;]?\d{0,2}$')
+_ROOT_NUMBER = re.compile(rf'([{ROOT_CHARS}]{{2,6}})\s*(\d+)')
+
+# Target of a cross-reference entry ("root → target"); matched right after the root
+_XREF_TAIL = re.compile(r'\s*→\s*([ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzḏṯẓāēīūə]+)')
+
+# Context checks around a root candidate in extract_roots_from_section. They are run
+# with pos/endpos on the section string, so '$' anchors at the end of the lookbehind window.
+_FORM_WITH_SLASH_TAIL = re.compile(r'<span[^>]*>[^<]*\/[^<]+</span></p>\s*$', re.DOTALL)
+_SPECIAL_STEM_TAIL = re.compile(r'<span[^>]*>(?:Detransitive|Action\s+[Nn]oun)</span></p>\s*$', re.DOTALL)
+_STEM_HEADER_TAIL = re.compile(r'<span[^>]*>[IVX]+:\s*</span></b></font></font>.*?<i><b><span[^>]*>[^<]+</span></b></i></font></font></p>\s*$', re.DOTALL)
+_ROOT_CONTINUATION = re.compile(rf'</font><font[^>]*><span[^>]*>([{ROOT_CHARS}]+)</span>')
+_ITALIC_NUM = re.compile(r'<i><span[^>]*>\s*(\d+)\s+\(')
+_SEPARATE_NUM = re.compile(r'<span[^>]*>\s*(\d+)\s*</span>', re.DOTALL)
+_SUP_NUM = re.compile(r'<sup[^>]*>.*?(\d+).*?</sup>', re.DOTALL)
+
+
+# Letters specific to Turoyo transcription (used to tell verb forms from glosses)
+_TUROYO_SPECIAL_CHARS = frozenset('ʔʕġǧḥṣštṭḏṯẓāēīūə')
+
+# Etymology "(< ...)" and the layouts of a single etymon inside it
+_ETYMOLOGY = re.compile(r'\(&lt;\s*(.+?)\s*\)(?:\s*[A-Z<]|$)', re.DOTALL)
+_AND_SEPARATOR = re.compile(r'[;,]\s*and\s+')
+_ETYMON_STRUCTURED = re.compile(r'([A-Za-z.]+)\s+([^\s]+)\s+(?:\([^)]+\)\s+)?cf\.\s+([^:]+):\s*(.+)', re.DOTALL)
+_ETYMON_NO_CF = re.compile(r'([A-Za-z.]+)\s+([^\s,]+),\s+([^:]+):\s*(.+)', re.DOTALL)
+_ETYMON_SIMPLE = re.compile(r'([A-Za-z.]+)\s+(.+)')
+
+# Stem header and its forms in paragraph layout (fallback for parse_stems)
+_STEM_PARAGRAPH = re.compile(r'<p[^>]*>.*?<span[^>]*>([IVX]+):</span>.*?</p>')
+_BOLD_ITALIC_FORMS = re.compile(r'<i><b><span[^>]*>([^<]+)</span>')
+_ITALIC_FORMS = re.compile(r'<i><span[^>]*>([^<]+)</span>')
+_DETRANSITIVE_PARAGRAPH = re.compile(r'<p[^>]*><span[^>]*>Detransitive.*?</p>', re.DOTALL)
+_SLASHED_FORMS = re.compile(r'<span[^>]*>([^<]*\/[^<]+)</span>')
+_ROMAN_LABEL = re.compile(r'^([IVX]+):?$')
+_STEM_LABEL = re.compile(r'<font size="4"[^>]*><b><span[^>]*>([IVX]+):\s*</span>')
+# Literal prefix of every stem header / label match: entries without it skip those scans
+_STEM_FONT = '<font size="4"'
+
+_DETRANSITIVE_HEADER = re.compile(r'<font size="4" style="font-size: 16pt"><b><span[^>]*>Detransitive')
+_DETRANSITIVE_LINE = re.compile(r'<p[^>]*><span[^>]*>Detransitive</span></p>')
+
+# Conjugation tables: one row per conjugation; _ROW_CELLS takes the header cell and
+# the examples cell (the first two <td>s) in one match.
+_TABLE = re.compile(r'<table[^>]*>(.*?)</table>', re.DOTALL)
+_TABLE_ROW = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
+_ROW_CELLS = re.compile(r'<td[^>]*>(.*?)</td>.*?<td[^>]*>(.*?)</td>', re.DOTALL)
+_SPAN_TEXT = re.compile(r'<span[^>]*>([^<]+)</span>')
+
+# Fragments for html_to_tokens are parsed straight into lxml trees (no BeautifulSoup layer)
+_HTML_PARSER = etree.HTMLParser()
+_BLOCK_ELEMENTS = frozenset({'p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr', 'td'})
+
+# Quoted translation inside a table-cell span: ʻ...ʼ, '...' or "..."
+_QUOTED_TRANSLATION = re.compile(r'[ʻ\'\"]([^ʼ\'\"]{3,})[ʼ\'\"]')
+
+# Stem header in its font-wrapped layouts: "I: " + italic forms span. Its "[^:]*"
+# can run across tags up to a later header's colon, so it is a pass of its own.
+_STEM_HEADER = re.compile(
+    r'<font size="4"[^>]*><b><span[^>]*>([IVX]+)(?:[^:]*)?:\s*</span></b></font></font><font[^>]*><font[^>]*><i><b><span[^>]*>([^<]+)</span>'
+)
+# "I" without colon + forms span, and "I: forms" in one span; neither can
+# reach into the other, so they share the second pass
+_STEM_HEADER_VARIANT = re.compile(
+    r'<font size="4"[^>]*><b><span[^>]*>(?:'
+    r'(?P<no_colon>[IVX]+)</span></b></font></font><font[^>]*><font[^>]*><i><b><span[^>]*>(?P<no_colon_forms>[^<]+)</span>'
+    r'|(?P<combined>[IVX]+):\s*(?P<combined_forms>[^<]+)</span></b></font>'
+    r')'
+)
+
+
+# Conjugation header spellings in the source mapped to canonical names
+_HEADER_NAMES = {
+    'Imperativ': 'Imperative',
+    'Infinitiv': 'Infinitive',
+    'Preterite': 'Preterit',
+    'Preterit 1': 'Preterit 1',
+    'Preterit 2': 'Preterit 2',
+    'k-Preterit': 'k-Preterit',
+    'ko-Preterit': 'ko-Preterit',
+    ' Infectum': 'Infectum',
+    'Infectum - wa': 'Infectum-wa',
+    'Infectum – wa': 'Infectum-wa',
+    'Infectum – Transitive': 'Infectum-Transitive',
+    'Detransitive infectum': 'Detransitive Infectum',
+    'Part act.': 'Participle_Active',
+    'Part. act.': 'Participle_Active',
+    'Part. Act.': 'Participle_Active',
+    'Part act': 'Participle_Active',
+    'Part pass.': 'Participle_Passive',
+    'Part. pass.': 'Participle_Passive',
+    'Part. Pass.': 'Participle_Passive',
+    'Part.Pass': 'Participle_Passive',
+    'Pass. Part.': 'Participle_Passive',
+    'Passive Part.': 'Participle_Passive',
+    'Part': 'Participle',
+    'Participle': 'Participle',
+    'Nomen Patiens': 'Nomen Patiens',
+    'Nomen Patientis?': 'Nomen Patiens',
+    'Nomen Actionis': 'Nomen Actionis',
+    'Nomen agentis': 'Nomen agentis',
+}
+
+
+@lru_cache(maxsize=256)
+def _normalize_header_cached(header: str) -> tuple[str, ...]:
+    """Normalize one raw conjugation header (cached: the header vocabulary is small)
+
+    Names are interned so every conjugations dict shares one key object per name.
+    """
+    h = ' '.join(header.split())
+    h = _HEADER_NAMES.get(h, h)
+    if ' and ' in h:
+        return tuple(sys.intern(_HEADER_NAMES.get(p.strip(), p.strip())) for p in h.split(' and ') if p.strip())
+    return (sys.intern(h),)
+
+
+# Font switches inside an etymology between italic and roman runs stand for
+# a word break; every other tag is dropped by strip_tags
+_ETYMOLOGY_FONT_SWITCH = re.compile(
+    r'</span></i></font></font><font[^>]*><font[^>]*><i><span[^>]*>'
+    r'|</span></i></font></font><font[^>]*><span[^>]*>'
+    r'|</span></i></font><font[^>]*><i><span[^>]*>'
+)
+_TAG = re.compile(r'<[^>]+>')
+
+
+def strip_tags(text: str, repl: str = '') -> str:
+    """Replace every tag with repl"""
+    if '<' not in text:
+        return text
+    return _TAG.sub(repl, text)
+
+
+def _split_forms(forms_text: str) -> list[str]:
+    """Split 'məlle/omər' into its forms, stripping each fragment once"""
+    return [f for f in map(str.strip, forms_text.split('/')) if f]
+
+
+def _is_reference(text: str) -> bool:
+    """Check whether text is a bare reference like '24/147; [A]'"""
+    if not text:
+        return False
+    for c in text:
+        if not ('A' <= c <= 'Z' or c in ';/[]' or c.isdecimal() or c.isspace()):
+            return False
+    return True
 
 
 class TuroyoVerbParser:
@@ -31,45 +200,57 @@ class TuroyoVerbParser:
 
     def __init__(self, html_path):
         self.html_path = Path(html_path)
-        with open(html_path, 'r', encoding='utf-8') as f:
-            self.html = f.read()
 
         self.verbs = []
         self.stats = defaultdict(int)
         self.errors = []
 
 
-    def split_by_letters(self):
-        """Split HTML into letter sections"""
-        letter_pattern = r'<h1[^>]*>\s*<span[^>]*>(?:&shy;)?([ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzžḏṯẓāēīūə])</span></h1>'
-        matches = list(re.finditer(letter_pattern, self.html))
+    def find_letter_sections(self) -> list[tuple[str, int, int]]:
+        """Locate letter sections as (letter, start, end) byte offsets into the source file"""
+        with open(self.html_path, 'rb') as f:
+            # An empty file has no sections (and mmap cannot map it)
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                matches = list(_LETTER_HEADER.finditer(source))
 
-        sections = []
-        for i, match in enumerate(matches):
-            letter = match.group(1)
-            start = match.end()
-            end = matches[i+1].start() if i+1 < len(matches) else len(self.html)
-            sections.append((letter, self.html[start:end]))
+                sections = []
+                for i, match in enumerate(matches):
+                    letter = match.group(1).decode('utf-8')
+                    start = match.end()
+                    end = matches[i+1].start() if i+1 < len(matches) else len(source)
+                    sections.append((letter, start, end))
 
         return sections
 
-    def extract_roots_from_section(self, section_html):
-        """Extract verb entries from a letter section"""
-        ROOT_CHARS = 'ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzžḏṯẓāēīūə'
-        root_pattern = rf'<p[^>]*class="western"[^>]*>(?:<font[^>]*>)*(?:<i[^>]*>)?<span[^>]*>([{ROOT_CHARS}]{{2,6}})(?:\s*\d+)?[^<]*</span>'
+    def split_by_letters(self) -> list[tuple[str, str]]:
+        """Split HTML into letter sections"""
+        return [(letter, _read_section(self.html_path, start, end))
+                for letter, start, end in self.find_letter_sections()]
 
+    def extract_roots_from_section(self, section_html: str) -> list[tuple[str, str]]:
+        """Extract verb entries from a letter section"""
         valid_matches = []
-        for match in re.finditer(root_pattern, section_html):
+        # Last table open/close tags before the current match, advanced incrementally
+        # so the whole section is scanned once rather than back to its start per root
+        last_table_open = last_table_close = -1
+        scanned_to = 0
+        for match in _ROOT_PARAGRAPH.finditer(section_html):
             root_chars = match.group(1)
 
-            SPECIAL_TUROYO_CHARS = 'ʔʕġǧḥṣṭḏṯẓčšžāēīūə'
+            table_open = section_html.rfind('<table', scanned_to, match.start())
+            if table_open != -1:
+                last_table_open = table_open
+            table_close = section_html.rfind('</table>', scanned_to, match.start())
+            if table_close != -1:
+                last_table_close = table_close
+            scanned_to = match.start()
 
             span_content = match.group(0)
-            span_text_match = re.search(r'<span[^>]*>([^<]+)</span>', span_content)
+            span_text_match = _SPAN_TEXT.search(span_content)
             if span_text_match:
-                before = section_html[:match.start()]
-                last_table_open = before.rfind('<table')
-                last_table_close = before.rfind('</table>')
                 if last_table_open != -1 and (last_table_close == -1 or last_table_open > last_table_close):
                     continue
 
@@ -78,46 +259,43 @@ class TuroyoVerbParser:
                 if len(cleaned_span.split()) > 2:
                     continue
                 trailing = cleaned_span[len(root_chars):].strip()
-                if trailing and not re.match(r'^[.:;]?\d{0,2}$', trailing):
+                if trailing and not _ROOT_TRAILER.match(trailing):
                     continue
-                if ';' in full_span_text and not any(c in full_span_text for c in SPECIAL_TUROYO_CHARS):
+                if ';' in full_span_text and _ROOT_SPECIAL_CHARS.isdisjoint(full_span_text):
                     continue
 
             lookbehind_start = max(0, match.start() - 300)
-            lookbehind = section_html[lookbehind_start:match.start()]
 
-            if not any(c in root_chars for c in SPECIAL_TUROYO_CHARS):
-                form_with_slash = re.search(r'<span[^>]*>[^<]*\/[^<]+</span></p>\s*$', lookbehind, re.DOTALL)
-                if form_with_slash:
+            if _ROOT_SPECIAL_CHARS.isdisjoint(root_chars):
+                if _FORM_WITH_SLASH_TAIL.search(section_html, lookbehind_start, match.start()):
                     continue
-            if re.search(r'<span[^>]*>(?:Detransitive|Action\s+[Nn]oun)</span></p>\s*$', lookbehind, re.DOTALL):
+            if _SPECIAL_STEM_TAIL.search(section_html, lookbehind_start, match.start()):
                 continue
 
-            if re.search(r'<span[^>]*>[IVX]+:\s*</span></b></font></font>.*?<i><b><span[^>]*>[^<]+</span></b></i></font></font></p>\s*$', lookbehind, re.DOTALL):
+            if _STEM_HEADER_TAIL.search(section_html, lookbehind_start, match.start()):
                 continue
 
-            lookahead_cont = section_html[match.end():match.end()+100]
-            cont_match = re.search(r'</font><font[^>]*><span[^>]*>([ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzžḏṯẓāēīūə]+)</span>', lookahead_cont)
+            cont_match = _ROOT_CONTINUATION.search(section_html, match.end(), match.end() + 100)
             if cont_match:
                 root_chars = root_chars + cont_match.group(1)
 
             full_match = match.group(0)
-            number_match = re.search(r'([ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzžḏṯẓāēīūə]{2,6})\s*(\d+)', full_match)
+            number_match = _ROOT_NUMBER.search(full_match)
 
             if number_match:
                 root = f"{root_chars} {number_match.group(2)}"
             else:
-                lookahead = section_html[match.end():match.end()+300]
+                lookahead_end = match.end() + 300
 
-                italic_num = re.search(r'<i><span[^>]*>\s*(\d+)\s+\(', lookahead)
+                italic_num = _ITALIC_NUM.search(section_html, match.end(), lookahead_end)
                 if italic_num:
                     root = f"{root_chars} {italic_num.group(1)}"
                 else:
-                    sep_num = re.search(r'<span[^>]*>\s*(\d+)\s*</span>', lookahead, re.DOTALL)
+                    sep_num = _SEPARATE_NUM.search(section_html, match.end(), lookahead_end)
                     if sep_num:
                         root = f"{root_chars} {sep_num.group(1)}"
                     else:
-                        sup_num = re.search(r'<sup[^>]*>.*?(\d+).*?</sup>', lookahead, re.DOTALL)
+                        sup_num = _SUP_NUM.search(section_html, match.end(), lookahead_end)
                         if sup_num:
                             root = f"{root_chars} {sup_num.group(1)}"
                         else:
@@ -135,40 +313,44 @@ class TuroyoVerbParser:
         return roots
 
 
-    def walk_and_extract(self, element, in_italic=False):
+    def walk_and_extract(self, element, in_italic: bool = False) -> list[tuple[bool, str]]:
         """
-        Walk DOM tree and extract text with italic markers.
+        Walk an lxml element tree and extract text with italic markers.
         Returns list of (is_italic, text) tuples.
 
         CRITICAL: Adds spacing after block-level elements to fix text concatenation bug.
         """
         result = []
 
-        block_elements = {'p', 'div', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr', 'td'}
+        current_italic = in_italic or (element.tag == 'i')
 
-        if isinstance(element, NavigableString):
-            text = str(element)
-            if text.strip():
-                result.append((in_italic, text))
-            return result
+        text = element.text
+        if text and text.strip():
+            result.append((current_italic, text))
 
-        current_italic = in_italic or (element.name == 'i')
-
-        for child in element.children:
+        for child in element:
             result.extend(self.walk_and_extract(child, current_italic))
+            tail = child.tail
+            if tail and tail.strip():
+                result.append((current_italic, tail))
 
-        if element.name in block_elements and result:
-            last_italic = result[-1][0] if result else in_italic
-            result.append((last_italic, ' '))
+        if element.tag in _BLOCK_ELEMENTS and result:
+            result.append((result[-1][0], ' '))
 
         return result
 
-    def html_to_tokens(self, html):
+    def html_to_tokens(self, html: str) -> list[dict]:
         """Convert HTML to token array with italic markers"""
         if not html:
             return []
-        soup = BeautifulSoup(html, 'html.parser')
-        pairs = self.walk_and_extract(soup)
+        root = etree.fromstring(html, _HTML_PARSER)
+        if root is None:
+            return []
+        return self.tree_to_tokens(root)
+
+    def tree_to_tokens(self, root) -> list[dict]:
+        """Convert a parsed lxml tree to token array with italic markers"""
+        pairs = self.walk_and_extract(root)
         tokens = []
         for is_italic, text in pairs:
             if text and (text.strip() or text == ' '):
@@ -176,25 +358,25 @@ class TuroyoVerbParser:
         return tokens
 
 
-    def normalize_whitespace(self, text):
+    def has_turoyo_chars(self, text: str) -> bool:
+        """Check for Turoyo-specific letters (marks a string as transcribed forms)"""
+        return not _TUROYO_SPECIAL_CHARS.isdisjoint(text)
+
+    def normalize_whitespace(self, text: str) -> str:
         if not text:
             return ""
-        return re.sub(r'\s+', ' ', text).strip()
+        return ' '.join(text.split())
 
     def parse_etymology(self, entry_html):
         """Parse etymology with support for multiple sources"""
-        etym_pattern = r'\(&lt;\s*(.+?)\s*\)(?:\s*[A-Z<]|$)'
-        match = re.search(etym_pattern, entry_html, re.DOTALL)
+        match = _ETYMOLOGY.search(entry_html)
 
         if not match:
             return None
 
         etym_text = match.group(1).strip().rstrip(';').strip()
 
-        etym_text = re.sub(r'</span></i></font></font><font[^>]*><font[^>]*><i><span[^>]*>', ' ', etym_text)
-        etym_text = re.sub(r'</span></i></font></font><font[^>]*><span[^>]*>', ' ', etym_text)
-        etym_text = re.sub(r'</span></i></font><font[^>]*><i><span[^>]*>', ' ', etym_text)
-        etym_text = re.sub(r'<[^>]+>', '', etym_text)
+        etym_text = strip_tags(_ETYMOLOGY_FONT_SWITCH.sub(' ', etym_text))
         etym_text = html.unescape(etym_text)
         etym_text = self.normalize_whitespace(etym_text)
         raw_with_bracket = f"< {etym_text}"
@@ -210,7 +392,7 @@ class TuroyoVerbParser:
             etymon_parts = [part.strip() for part in etym_text.split(' or ')]
         elif '; and ' in etym_text or ', and ' in etym_text:
             relationship = 'and'
-            etymon_parts = [part.strip() for part in re.split(r'[;,]\s*and\s+', etym_text)]
+            etymon_parts = [part.strip() for part in _AND_SEPARATOR.split(etym_text)]
 
         etymons = []
         for part in etymon_parts:
@@ -229,10 +411,7 @@ class TuroyoVerbParser:
 
     def _parse_single_etymon(self, etym_text):
         """Parse a single etymon"""
-        structured = re.match(
-            r'([A-Za-z.]+)\s+([^\s]+)\s+(?:\([^)]+\)\s+)?cf\.\s+([^:]+):\s*(.+)',
-            etym_text, re.DOTALL
-        )
+        structured = _ETYMON_STRUCTURED.match(etym_text)
         if structured:
             return {
                 'source': structured.group(1).strip(),
@@ -241,10 +420,7 @@ class TuroyoVerbParser:
                 'meaning': self.normalize_whitespace(structured.group(4)),
             }
 
-        no_cf = re.match(
-            r'([A-Za-z.]+)\s+([^\s,]+),\s+([^:]+):\s*(.+)',
-            etym_text, re.DOTALL
-        )
+        no_cf = _ETYMON_NO_CF.match(etym_text)
         if no_cf:
             return {
                 'source': no_cf.group(1).strip(),
@@ -253,7 +429,7 @@ class TuroyoVerbParser:
                 'meaning': self.normalize_whitespace(no_cf.group(4)),
             }
 
-        simple = re.match(r'([A-Za-z.]+)\s+(.+)', etym_text)
+        simple = _ETYMON_SIMPLE.match(etym_text)
         if simple:
             return {
                 'source': simple.group(1).strip(),
@@ -263,73 +439,57 @@ class TuroyoVerbParser:
         return {'raw': etym_text}
 
 
-    def parse_stems(self, entry_html):
+    def parse_stems(self, entry_html: str) -> list[dict]:
         """Find all stem headers"""
-        stem_pattern = r'<font size="4"[^>]*><b><span[^>]*>([IVX]+)(?:[^:]*)?:\s*</span></b></font></font><font[^>]*><font[^>]*><i><b><span[^>]*>([^<]+)</span>'
-
         stems = []
-        for match in re.finditer(stem_pattern, entry_html):
-            stem_num = match.group(1)
-            forms_text = match.group(2).strip()
-            forms = [f.strip() for f in forms_text.split('/') if f.strip()]
-
-            stems.append({
-                'stem': stem_num,
-                'forms': forms,
-                'position': match.start()
-            })
-
-        no_colon_pattern = r'<font size="4"[^>]*><b><span[^>]*>([IVX]+)</span></b></font></font><font[^>]*><font[^>]*><i><b><span[^>]*>([^<]+)</span>'
-        for match in re.finditer(no_colon_pattern, entry_html):
-            if any(s['position'] == match.start() for s in stems):
-                continue
+        seen_positions = set()
+        if _STEM_FONT in entry_html:
+            for match in _STEM_HEADER.finditer(entry_html):
+                stems.append({
+                    'stem': match.group(1),
+                    'forms': _split_forms(match.group(2).strip()),
+                    'position': match.start()
+                })
+                seen_positions.add(match.start())
 
-            stem_num = match.group(1)
-            forms_text = match.group(2).strip()
-            if '/' in forms_text or any(c in forms_text for c in 'ʔʕġǧḥṣštṭḏṯẓāēīūə'):
-                forms = [f.strip() for f in forms_text.split('/') if f.strip()]
-                if forms:
-                    stems.append({
-                        'stem': stem_num,
-                        'forms': forms,
-                        'position': match.start()
-                    })
+            for match in _STEM_HEADER_VARIANT.finditer(entry_html):
+                if match.start() in seen_positions:
+                    continue
 
-        combined_pattern = r'<font size="4"[^>]*><b><span[^>]*>([IVX]+):\s*([^<]+)</span></b></font>'
-        for match in re.finditer(combined_pattern, entry_html):
-            if any(s['position'] == match.start() for s in stems):
-                continue
+                stem_num = match.group('no_colon') or match.group('combined')
+                forms_text = (match.group('no_colon_forms') or match.group('combined_forms')).strip()
+                if not ('/' in forms_text or self.has_turoyo_chars(forms_text)):
+                    continue
+                forms = _split_forms(forms_text)
+                if not forms:
+                    continue
 
-            stem_num = match.group(1)
-            forms_text = match.group(2).strip()
-            if '/' in forms_text or any(c in forms_text for c in 'ʔʕġǧḥṣštṭḏṯẓāēīūə'):
-                forms = [f.strip() for f in forms_text.split('/') if f.strip()]
-                if forms:
-                    stems.append({
-                        'stem': stem_num,
-                        'forms': forms,
-                        'position': match.start()
-                    })
+                stems.append({
+                    'stem': stem_num,
+                    'forms': forms,
+                    'position': match.start()
+                })
+                seen_positions.add(match.start())
 
-        fallback_pattern = r'<p[^>]*>.*?<span[^>]*>([IVX]+):</span>.*?</p>'
-        for match in re.finditer(fallback_pattern, entry_html):
-            if any(s['position'] == match.start() for s in stems):
+        paragraphs = _STEM_PARAGRAPH.finditer(entry_html) if ':</span>' in entry_html else ()
+        for match in paragraphs:
+            if match.start() in seen_positions:
                 continue
 
             stem_num = match.group(1)
             lookahead = entry_html[match.end():match.end()+500]
 
-            forms_match = re.search(r'<i><b><span[^>]*>([^<]+)</span>', lookahead)
+            forms_match = _BOLD_ITALIC_FORMS.search(lookahead)
             if not forms_match:
-                forms_match = re.search(r'<i><span[^>]*>([^<]+)</span>', lookahead)
+                forms_match = _ITALIC_FORMS.search(lookahead)
 
             if not forms_match:
-                lookahead_skip = re.sub(r'<p[^>]*><span[^>]*>Detransitive.*?</p>', '', lookahead, flags=re.DOTALL)
-                forms_match = re.search(r'<span[^>]*>([^<]*\/[^<]+)</span>', lookahead_skip)
+                lookahead_skip = _DETRANSITIVE_PARAGRAPH.sub('', lookahead)
+                forms_match = _SLASHED_FORMS.search(lookahead_skip)
 
             if forms_match:
                 forms_text = forms_match.group(1).strip().replace('?', '')
-                forms = [f.strip() for f in forms_text.split('/') if f.strip() and f != '?']
+                forms = _split_forms(forms_text)
                 if forms:
                     stems.append({
                         'stem': stem_num,
@@ -343,13 +503,11 @@ class TuroyoVerbParser:
 
         # Fallback for simplified markup (e.g. tests) where the font nesting is lighter
         soup = BeautifulSoup(entry_html, 'html.parser')
-        roman_re = re.compile(r'^([IVX]+):?$')
-        special_chars = 'ʔʕġǧḥṣštṭḏṯẓāēīūə'
         spans = list(soup.find_all('span'))
 
         for idx, span in enumerate(spans):
             text = self.normalize_whitespace(span.get_text())
-            m = roman_re.match(text)
+            m = _ROMAN_LABEL.match(text)
             if not m:
                 continue
 
@@ -357,11 +515,11 @@ class TuroyoVerbParser:
             forms = []
             for following in spans[idx + 1:]:
                 f_text = self.normalize_whitespace(following.get_text())
-                if roman_re.match(f_text):
+                if _ROMAN_LABEL.match(f_text):
                     break
-                if '/' in f_text or any(c in f_text for c in special_chars):
+                if '/' in f_text or self.has_turoyo_chars(f_text):
                     clean = f_text.replace('?', '')
-                    forms = [f.strip() for f in clean.split('/') if f.strip() and f != '?']
+                    forms = _split_forms(clean)
                     if forms:
                         break
             if forms:
@@ -375,39 +533,42 @@ class TuroyoVerbParser:
 
     def find_detransitive_position(self, entry_html):
         """Find Detransitive section position"""
-        detrans_pattern1 = r'<font size="4" style="font-size: 16pt"><b><span[^>]*>Detransitive'
-        match1 = re.search(detrans_pattern1, entry_html)
+        if 'Detransitive' not in entry_html:
+            return None
+
+        match1 = _DETRANSITIVE_HEADER.search(entry_html)
         if match1:
             return match1.start()
 
-        detrans_pattern2 = r'<p[^>]*><span[^>]*>Detransitive</span></p>'
-        match2 = re.search(detrans_pattern2, entry_html)
+        match2 = _DETRANSITIVE_LINE.search(entry_html)
         if match2:
             return match2.start()
 
         return None
 
-    def parse_table_cell_examples(self, cell_html):
+    def parse_table_cell_examples(self, cell_html: str) -> list[dict]:
         """Extract examples from table cell"""
-        soup = BeautifulSoup(cell_html, 'html.parser')
-        examples = []
-        paragraphs = soup.find_all('p')
-
-        for para in paragraphs:
+        examples: list[dict] = []
+        root = etree.fromstring(cell_html, _HTML_PARSER)
+        if root is None:
+            return examples
+
+        # Read the text straight off the lxml tree: itertext() is the C-level
+        # equivalent of get_text() (comments skipped) without the bs4 wrappers
+        for para in root.iter('p'):
             parts = []
-            for element in para.descendants:
-                if isinstance(element, Tag):
-                    if element.name == 'i':
-                        text = element.get_text()
-                        if text:
-                            parts.append(('turoyo', text))
-                    elif element.name == 'span' and not element.find_parent('i'):
-                        text = element.get_text().strip()
-                        if text and len(text) > 1 and not text.isdigit():
-                            parts.append(('translation', text))
+            for element in para.iter('i', 'span'):
+                if element.tag == 'i':
+                    text = ''.join(element.itertext())
+                    if text:
+                        parts.append(('turoyo', text))
+                elif next(element.iterancestors('i'), None) is None:
+                    text = ''.join(element.itertext()).strip()
+                    if text and len(text) > 1 and not text.isdigit():
+                        parts.append(('translation', text))
 
             if parts:
-                current_example = {
+                current_example: dict[str, list[str]] = {
                     'turoyo': [],
                     'translations': [],
                     'references': []
@@ -416,19 +577,19 @@ class TuroyoVerbParser:
                 for typ, text in parts:
                     if typ == 'turoyo':
                         stripped = text.strip()
-                        if re.match(r'^[\d;/\s\[\]A-Z]+$', stripped):
+                        if _is_reference(stripped):
                             current_example['references'].append(self.normalize_whitespace(stripped))
                         else:
                             current_example['turoyo'].append(text)
                     elif typ == 'translation':
-                        quotes = re.findall(r'[ʻ\'\"]([^ʼ\'\"]{3,})[ʼ\'\"]', text)
+                        quotes = _QUOTED_TRANSLATION.findall(text)
                         if quotes:
                             current_example['translations'].extend([self.normalize_whitespace(q) for q in quotes])
                         elif len(text) > 10:
                             current_example['translations'].append(self.normalize_whitespace(text))
 
                 turoyo_text = ''.join(current_example['turoyo'])
-                turoyo_text = re.sub(r'\s+', ' ', turoyo_text).strip()
+                turoyo_text = ' '.join(turoyo_text.split())
 
                 example = {
                     'turoyo': turoyo_text,
@@ -441,30 +602,28 @@ class TuroyoVerbParser:
 
         return examples
 
-    def extract_tables(self, entry_html, start_pos=0, end_pos=None):
+    def extract_tables(self, entry_html: str, start_pos: int = 0, end_pos: int | None = None) -> dict[str, list[dict]]:
         """Extract all tables in range"""
         if end_pos is None:
             end_pos = len(entry_html)
 
-        fragment = entry_html[start_pos:end_pos]
-        table_pattern = r'<table[^>]*>(.*?)</table>'
-        tables_data = {}
+        if entry_html.find('<table', start_pos, end_pos) == -1:
+            return {}
 
-        for table_match in re.finditer(table_pattern, fragment, re.DOTALL):
-            table_html = table_match.group(0)
-            row_pattern = r'<tr[^>]*>(.*?)</tr>'
-            rows = re.findall(row_pattern, table_html, re.DOTALL)
+        tables_data: dict[str, list[dict]] = {}
 
-            for row in rows:
-                cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)
+        # Scan entry_html in place with pos/endpos instead of slicing out each region
+        for table_match in _TABLE.finditer(entry_html, start_pos, end_pos):
+            for row in _TABLE_ROW.finditer(entry_html, table_match.start(), table_match.end()):
+                cells = _ROW_CELLS.search(entry_html, row.start(1), row.end(1))
 
-                if len(cells) >= 2:
-                    header_match = re.search(r'<span[^>]*>([^<]+)</span>', cells[0])
+                if cells:
+                    header_match = _SPAN_TEXT.search(cells.group(1))
                     if not header_match:
                         continue
 
                     headers = self.normalize_header(header_match.group(1).strip())
-                    examples = self.parse_table_cell_examples(cells[1])
+                    examples = self.parse_table_cell_examples(cells.group(2))
 
                     if examples:
                         for h in headers:
@@ -475,62 +634,27 @@ class TuroyoVerbParser:
 
         return tables_data
 
-    def normalize_header(self, header):
+    def normalize_header(self, header: str) -> list[str]:
         """Normalize conjugation headers"""
-        h = self.normalize_whitespace(header)
-        mapping = {
-            'Imperativ': 'Imperative',
-            'Infinitiv': 'Infinitive',
-            'Preterite': 'Preterit',
-            'Preterit 1': 'Preterit 1',
-            'Preterit 2': 'Preterit 2',
-            'k-Preterit': 'k-Preterit',
-            'ko-Preterit': 'ko-Preterit',
-            ' Infectum': 'Infectum',
-            'Infectum - wa': 'Infectum-wa',
-            'Infectum – wa': 'Infectum-wa',
-            'Infectum – Transitive': 'Infectum-Transitive',
-            'Detransitive infectum': 'Detransitive Infectum',
-            'Part act.': 'Participle_Active',
-            'Part. act.': 'Participle_Active',
-            'Part. Act.': 'Participle_Active',
-            'Part act': 'Participle_Active',
-            'Part pass.': 'Participle_Passive',
-            'Part. pass.': 'Participle_Passive',
-            'Part. Pass.': 'Participle_Passive',
-            'Part.Pass': 'Participle_Passive',
-            'Pass. Part.': 'Participle_Passive',
-            'Passive Part.': 'Participle_Passive',
-            'Part': 'Participle',
-            'Participle': 'Participle',
-            'Nomen Patiens': 'Nomen Patiens',
-            'Nomen Patientis?': 'Nomen Patiens',
-            'Nomen Actionis': 'Nomen Actionis',
-            'Nomen agentis': 'Nomen agentis',
-        }
-        h = mapping.get(h, h)
-        if ' and ' in h:
-            parts = [mapping.get(p.strip(), p.strip()) for p in h.split(' and ') if p.strip()]
-            return parts
-        return [h]
+        return list(_normalize_header_cached(header))
 
 
     def extract_lemma_header_raw(self, fragment_html):
         """Extract the lemma header HTML (between root and first stem)"""
-        stem_pattern = r'<font size="4"[^>]*><b><span[^>]*>([IVX]+):\s*</span>'
-        stem = re.search(stem_pattern, fragment_html)
+        stem = _STEM_LABEL.search(fragment_html) if _STEM_FONT in fragment_html else None
         if stem:
             header_html = fragment_html[:stem.start()]
         else:
-            table_m = re.search(r'<table', fragment_html)
-            header_html = fragment_html[:table_m.start()] if table_m else fragment_html
+            table_pos = fragment_html.find('<table')
+            header_html = fragment_html[:table_pos] if table_pos != -1 else fragment_html
         return header_html.strip()
 
     def extract_stem_labels(self, fragment_html):
         """Extract stem label HTML for each stem"""
-        stem_pattern = r'<font size="4"[^>]*><b><span[^>]*>([IVX]+):\s*</span>'
         labels = {}
-        headers = list(re.finditer(stem_pattern, fragment_html))
+        if _STEM_FONT not in fragment_html:
+            return labels
+        headers = list(_STEM_LABEL.finditer(fragment_html))
 
         for i, m in enumerate(headers):
             roman = m.group(1)
@@ -538,28 +662,54 @@ class TuroyoVerbParser:
             end_region = headers[i+1].start() if i + 1 < len(headers) else len(fragment_html)
             region = fragment_html[start:end_region]
 
-            table = re.search(r'<table', region)
-            end = table.start() if table else len(region)
+            end = region.find('<table')
+            if end == -1:
+                end = len(region)
             label_html = region[:end].strip()
             labels[roman] = label_html
 
         return labels
 
-    def extract_gloss_html_from_label(self, label_html):
-        """Remove forms from label, return only gloss HTML"""
-        try:
-            soup = BeautifulSoup(label_html, 'html.parser')
-            ib = soup.find('i')
-            if ib and ib.find('b') and ib.find('span'):
-                ib.decompose()
-            return str(soup)
-        except Exception:
-            return ''
+    def extract_gloss_tokens_from_label(self, label_html):
+        """Tokenize a stem label without its forms (the first <i> holding <b> and <span>)"""
+        if not label_html:
+            return []
+        root = etree.fromstring(label_html, _HTML_PARSER)
+        if root is None:
+            return []
+
+        forms = next(root.iter('i'), None)
+        if forms is not None and forms.find('.//b') is not None and forms.find('.//span') is not None:
+            # Drop the element but keep the text that follows it
+            parent = forms.getparent()
+            previous = forms.getprevious()
+            if forms.tail:
+                if previous is not None:
+                    previous.tail = (previous.tail or '') + forms.tail
+                else:
+                    parent.text = (parent.text or '') + forms.tail
+            parent.remove(forms)
+
+        return self.tree_to_tokens(root)
 
 
-    def parse_entry(self, root, entry_html):
+    def find_cross_reference(self, root: str, entry_html: str) -> str | None:
+        """Return the target root of a "root → target" entry, or None"""
+        if '→' not in entry_html:
+            return None
+
+        pos = entry_html.find(root)
+        while pos != -1:
+            match = _XREF_TAIL.match(entry_html, pos + len(root))
+            if match:
+                return match.group(1)
+            pos = entry_html.find(root, pos + 1)
+
+        return None
+
+    def parse_entry(self, root: str, entry_html: str) -> dict:
         """Parse complete verb entry"""
-        entry = {
+        entry: dict = {
             'root': root,
             'etymology': None,
             'cross_reference': None,
@@ -567,10 +717,9 @@ class TuroyoVerbParser:
             'uncertain': False
         }
 
-        xref_pattern = root + r'\s*→\s*([ʔʕbčdfgġǧhḥklmnpqrsṣštṭwxyzḏṯẓāēīūə]+)'
-        xref = re.search(xref_pattern, entry_html)
+        xref = self.find_cross_reference(root, entry_html)
         if xref:
-            entry['cross_reference'] = xref.group(1)
+            entry['cross_reference'] = xref
             self.stats['cross_references'] += 1
             return entry
 
@@ -578,7 +727,8 @@ class TuroyoVerbParser:
             entry['uncertain'] = True
             self.stats['uncertain_entries'] += 1
 
-        entry['etymology'] = self.parse_etymology(entry_html)
+        if '(&lt;' in entry_html:
+            entry['etymology'] = self.parse_etymology(entry_html)
 
         header_html = self.extract_lemma_header_raw(entry_html)
         entry['lemma_header_raw'] = header_html
@@ -611,8 +761,7 @@ class TuroyoVerbParser:
             if roman in stem_labels:
                 label_html = stem_labels[roman]
                 stem_data['label_raw'] = label_html
-                gloss_html = self.extract_gloss_html_from_label(label_html)
-                stem_data['label_gloss_tokens'] = self.html_to_tokens(gloss_html)
+                stem_data['label_gloss_tokens'] = self.extract_gloss_tokens_from_label(label_html)
 
             entry['stems'].append(stem_data)
             self.stats['stems_parsed'] += 1
@@ -639,15 +788,14 @@ class TuroyoVerbParser:
 
     def add_homonym_numbers(self):
         """Add sequential numbers to homonyms with different etymologies"""
+        root_counts = Counter(verb['root'] for verb in self.verbs)
         root_groups = defaultdict(list)
         for idx, verb in enumerate(self.verbs):
-            root_groups[verb['root']].append((idx, verb))
+            if root_counts[verb['root']] > 1:
+                root_groups[verb['root']].append((idx, verb))
 
         numbered_count = 0
         for root, entries in root_groups.items():
-            if len(entries) <= 1:
-                continue
-
             etymologies = []
             for idx, verb in entries:
                 etym = verb.get('etymology')
@@ -688,24 +836,45 @@ class TuroyoVerbParser:
             print(f"   ✅ Auto-numbered {numbered_count} homonym entries")
 
 
-    def parse_all(self):
-        """Main parsing pipeline"""
+    def parse_section(self, section_html):
+        """Parse every entry of one letter section into self.verbs"""
+        roots = self.extract_roots_from_section(section_html)
+
+        parsed = failed = 0
+        for root, entry_html in roots:
+            try:
+                entry = self.parse_entry(root, entry_html)
+                self.verbs.append(entry)
+                parsed += 1
+            except Exception as e:
+                self.errors.append(f"{root}: {e}")
+                failed += 1
+
+        self.stats['verbs_parsed'] += parsed
+        if failed:
+            self.stats['errors'] += failed
+
+    def parse_all(self, workers=None):
+        """Main parsing pipeline (workers: process count, default os.cpu_count())"""
         print("🔄 Parsing Turoyo verb data...")
 
-        sections = self.split_by_letters()
+        sections = self.find_letter_sections()
 
-        for idx, (letter, section_html) in enumerate(sections, 1):
-            print(f"  [{idx}/{len(sections)}] {letter}...", end='\r')
-            roots = self.extract_roots_from_section(section_html)
+        # Letter sections are independent, so parse them in worker processes.
+        # Letters vary a lot in size: submit the largest first so a big late
+        # section doesn't leave the other workers idle, then collect in document order.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for letter, start, end in sorted(sections, key=lambda s: s[1] - s[2]):
+                futures[start] = executor.submit(_parse_section, (self.html_path, start, end))
 
-            for root, entry_html in roots:
-                try:
-                    entry = self.parse_entry(root, entry_html)
-                    self.verbs.append(entry)
-                    self.stats['verbs_parsed'] += 1
-                except Exception as e:
-                    self.errors.append(f"{root}: {e}")
-                    self.stats['errors'] += 1
+            for idx, (letter, start, _) in enumerate(sections, 1):
+                verbs, stats, errors = futures[start].result()
+                print(f"  [{idx}/{len(sections)}] {letter}...", end='\r')
+                self.verbs.extend(verbs)
+                for key, value in stats.items():
+                    self.stats[key] += value
+                self.errors.extend(errors)
 
         print(f"\n✅ Parsed {self.stats['verbs_parsed']} verbs, {self.stats['stems_parsed']} stems")
 
@@ -720,28 +889,25 @@ class TuroyoVerbParser:
         output_file.parent.mkdir(exist_ok=True, parents=True)
 
         total_examples = sum(
-            sum(len(conj_data) for conj_data in stem['conjugations'].values())
+            sum(map(len, stem['conjugations'].values()))
             for verb in self.verbs
             for stem in verb['stems']
         )
 
         total_stems_including_detrans = self.stats['stems_parsed'] + self.stats.get('detransitive_entries', 0)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'verbs': self.verbs,
-                'metadata': {
-                    'total_verbs': len(self.verbs),
-                    'total_stems': self.stats['stems_parsed'],
-                    'detransitive_stems': self.stats.get('detransitive_entries', 0),
-                    'total_stems_including_detransitive': total_stems_including_detrans,
-                    'total_examples': total_examples,
-                    'cross_references': self.stats.get('cross_references', 0),
-                    'uncertain_entries': self.stats.get('uncertain_entries', 0),
-                    'homonyms_numbered': self.stats.get('homonyms_numbered', 0),
-                    'parser_version': '4.0.0-master'
-                }
-            }, f, ensure_ascii=False, indent=2)
+        metadata = {
+            'total_verbs': len(self.verbs),
+            'total_stems': self.stats['stems_parsed'],
+            'detransitive_stems': self.stats.get('detransitive_entries', 0),
+            'total_stems_including_detransitive': total_stems_including_detrans,
+            'total_examples': total_examples,
+            'cross_references': self.stats.get('cross_references', 0),
+            'uncertain_entries': self.stats.get('uncertain_entries', 0),
+            'homonyms_numbered': self.stats.get('homonyms_numbered', 0),
+            'parser_version': '4.0.0-master'
+        }
+        write_verbs_json(output_file, self.verbs, metadata)
 
         print(f"💾 Saved: {output_file}")
         print(f"   📊 {total_examples} examples across {total_stems_including_detrans} total stems ({self.stats['stems_parsed']} Roman + {self.stats.get('detransitive_entries', 0)} Detransitive)")
@@ -781,16 +947,30 @@ class TuroyoVerbParser:
             written_files.add(filename)
 
             filepath = output_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(verb, f, ensure_ascii=False, indent=2)
+            write_json(filepath, verb)
 
         print(f"✅ Created {len(self.verbs)} individual verb files in {output_dir}")
 
 
+def _read_section(html_path, start, end):
+    """Decode one byte range of the memory-mapped source file"""
+    if start >= end:
+        return ''
+    with open(html_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+        return source[start:end].decode('utf-8')
+
+
+def _parse_section(section):
+    """Worker for parse_all: parse one letter section, return (verbs, stats, errors)"""
+    html_path, start, end = section
+    parser = TuroyoVerbParser(html_path)
+    parser.parse_section(_read_section(html_path, start, end))
+    return parser.verbs, dict(parser.stats), parser.errors
+
+
 def main():
     """Run the complete parsing pipeline"""
     import argparse
-    import sys
 
     arg_parser = argparse.ArgumentParser(
         description='Parse Turoyo verb glossary from HTML source'
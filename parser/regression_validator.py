@@ -28,6 +28,8 @@ from collections import defaultdict
 from datetime import datetime
 import difflib
 
+from json_output import load_json, parse_json, write_json
+
 
 class ChangeType:
     """Classification of changes"""
@@ -68,17 +70,15 @@ class RegressionValidator:
             print("❌ No baseline found. Run: python3 parser/snapshot_baseline.py")
             sys.exit(1)
 
-        with open(baseline_file, 'r', encoding='utf-8') as f:
-            self.baseline = json.load(f)
+        self.baseline = load_json(baseline_file)
 
         print(f"✅ Loaded baseline: {len(self.baseline['verbs'])} verbs")
 
-    def compute_file_hash(self, filepath):
-        """Compute SHA256 hash of a file"""
-        sha256 = hashlib.sha256()
-        with open(filepath, 'rb') as f:
-            sha256.update(f.read())
-        return sha256.hexdigest()
+    def compute_file_hash(self, filepath, data=None):
+        """Compute SHA256 hash of a file (data: its bytes, if already read)"""
+        if data is None:
+            data = Path(filepath).read_bytes()
+        return hashlib.sha256(data).hexdigest()
 
     def load_current(self):
         """Load current parser output"""
@@ -87,11 +87,12 @@ class RegressionValidator:
         verb_files = sorted(self.verbs_dir.glob('*.json'))
         for filepath in verb_files:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    verb_data = json.load(f)
+                # Read each file once: the same bytes are parsed and hashed
+                raw = filepath.read_bytes()
+                verb_data = parse_json(raw)
 
                 root = verb_data['root']
-                file_hash = self.compute_file_hash(filepath)
+                file_hash = self.compute_file_hash(filepath, raw)
 
                 self.current[root] = {
                     'filename': filepath.name,
@@ -179,9 +180,13 @@ class RegressionValidator:
         elif not baseline_etym and current_etym:
             improvement_indicators.append("Added etymology")
 
+        # One pass over the baseline stems: compare examples and collect conjugation types
+        baseline_conj_types = set()
+        current_stems = current_struct.get('stems', [])
         for i, baseline_stem in enumerate(baseline_struct.get('stems', [])):
-            if i < len(current_struct.get('stems', [])):
-                current_stem = current_struct['stems'][i]
+            baseline_conj_types.update(baseline_stem['conjugation_types'])
+            if i < len(current_stems):
+                current_stem = current_stems[i]
                 baseline_examples = baseline_stem['example_count']
                 current_examples = current_stem['example_count']
 
@@ -197,11 +202,8 @@ class RegressionValidator:
         if self.has_html_artifacts(current_data):
             regression_indicators.append("Contains HTML artifacts")
 
-        baseline_conj_types = set()
         current_conj_types = set()
-        for stem in baseline_struct.get('stems', []):
-            baseline_conj_types.update(stem['conjugation_types'])
-        for stem in current_struct.get('stems', []):
+        for stem in current_stems:
             current_conj_types.update(stem['conjugation_types'])
 
         lost_conj = baseline_conj_types - current_conj_types
@@ -220,23 +222,23 @@ class RegressionValidator:
 
     def extract_structure(self, verb_data):
         """Extract structural metadata from verb data"""
+        stems = verb_data.get('stems', [])
         structure = {
             'root': verb_data.get('root'),
             'has_etymology': verb_data.get('etymology') is not None,
             'has_cross_reference': verb_data.get('cross_reference') is not None,
             'is_uncertain': verb_data.get('uncertain', False),
-            'stem_count': len(verb_data.get('stems', [])),
+            'stem_count': len(stems),
             'stems': []
         }
 
-        for stem in verb_data.get('stems', []):
+        for stem in stems:
+            conjugations = stem.get('conjugations', {})
             stem_info = {
                 'stem': stem.get('stem'),
                 'form_count': len(stem.get('forms', [])),
-                'conjugation_types': sorted(stem.get('conjugations', {}).keys()),
-                'example_count': sum(
-                    len(examples) for examples in stem.get('conjugations', {}).values()
-                )
+                'conjugation_types': sorted(conjugations),
+                'example_count': sum(map(len, conjugations.values()))
             }
             structure['stems'].append(stem_info)
 
@@ -477,8 +479,7 @@ class RegressionValidator:
         }
 
         json_file = self.validation_dir / 'regression_summary.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        write_json(json_file, summary)
 
         return summary
 
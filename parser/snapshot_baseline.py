@@ -18,13 +18,18 @@ Author: Claude Code
 Last Updated: 2025-10-16
 """
 
-import json
 import hashlib
 import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+from json_output import load_json, parse_json, write_json
+
+# Version of the extract_verb_structure() layout: bump it whenever that method
+# changes, so structures cached in an older baseline are not reused
+STRUCTURE_VERSION = 1
+
 
 class BaselineSnapshot:
     """Generate baseline snapshot of parser output"""
@@ -34,32 +39,31 @@ class BaselineSnapshot:
         self.baseline_dir = Path('data/baseline')
         self.baseline_dir.mkdir(parents=True, exist_ok=True)
 
-    def compute_file_hash(self, filepath):
-        """Compute SHA256 hash of a file"""
-        sha256 = hashlib.sha256()
-        with open(filepath, 'rb') as f:
-            sha256.update(f.read())
-        return sha256.hexdigest()
+    def compute_file_hash(self, filepath, data=None):
+        """Compute SHA256 hash of a file (data: its bytes, if already read)"""
+        if data is None:
+            data = Path(filepath).read_bytes()
+        return hashlib.sha256(data).hexdigest()
 
     def extract_verb_structure(self, verb_data):
         """Extract structural metadata from verb entry"""
+        stems = verb_data.get('stems', [])
         structure = {
             'root': verb_data.get('root'),
             'has_etymology': verb_data.get('etymology') is not None,
             'has_cross_reference': verb_data.get('cross_reference') is not None,
             'is_uncertain': verb_data.get('uncertain', False),
-            'stem_count': len(verb_data.get('stems', [])),
+            'stem_count': len(stems),
             'stems': []
         }
 
-        for stem in verb_data.get('stems', []):
+        for stem in stems:
+            conjugations = stem.get('conjugations', {})
             stem_info = {
                 'stem': stem.get('stem'),
                 'form_count': len(stem.get('forms', [])),
-                'conjugation_types': sorted(stem.get('conjugations', {}).keys()),
-                'example_count': sum(
-                    len(examples) for examples in stem.get('conjugations', {}).values()
-                )
+                'conjugation_types': sorted(conjugations),
+                'example_count': sum(map(len, conjugations.values()))
             }
             structure['stems'].append(stem_info)
 
@@ -82,6 +86,7 @@ class BaselineSnapshot:
             'metadata': {
                 'created': datetime.now().isoformat(),
                 'parser_version': '4.0.0-master',
+                'structure_version': STRUCTURE_VERSION,
                 'description': 'Known good parser output baseline'
             },
             'verbs': {},
@@ -98,20 +103,31 @@ class BaselineSnapshot:
             }
         }
 
+        # Files whose hash matches the previous baseline keep its structure
+        # instead of being parsed again
+        previous_entries = self.load_previous_entries()
+        reused = 0
+
         verb_files = sorted(self.verbs_dir.glob('*.json'))
         for i, filepath in enumerate(verb_files, 1):
             if i % 100 == 0:
                 print(f"   [{i}/{len(verb_files)}] Processing...", end='\r')
 
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    verb_data = json.load(f)
-
-                file_hash = self.compute_file_hash(filepath)
-
-                structure = self.extract_verb_structure(verb_data)
+                # Read each file once: the same bytes are parsed and hashed
+                raw = filepath.read_bytes()
+                file_hash = self.compute_file_hash(filepath, raw)
+
+                cached = previous_entries.get(filepath.name)
+                if cached and cached[1]['hash'] == file_hash:
+                    root, entry = cached
+                    structure = entry['structure']
+                    reused += 1
+                else:
+                    verb_data = parse_json(raw)
+                    structure = self.extract_verb_structure(verb_data)
+                    root = verb_data['root']
 
-                root = verb_data['root']
                 baseline['verbs'][root] = {
                     'filename': filepath.name,
                     'hash': file_hash,
@@ -133,9 +149,9 @@ class BaselineSnapshot:
 
                 if ' ' in root and root[-1].isdigit():
                     baseline['summary']['roots_with_homonyms'].append(root)
-                if verb_data.get('cross_reference'):
+                if structure['has_cross_reference']:
                     baseline['summary']['roots_with_cross_refs'].append(root)
-                if verb_data.get('uncertain'):
+                if structure['is_uncertain']:
                     baseline['summary']['uncertain_roots'].append(root)
 
             except Exception as e:
@@ -143,6 +159,8 @@ class BaselineSnapshot:
                 continue
 
         print(f"\n   ✅ Processed {baseline['summary']['total_files']} verb files")
+        if reused:
+            print(f"   ♻️  {reused} unchanged since the previous baseline")
 
         baseline['summary']['stem_type_counts'] = dict(baseline['summary']['stem_type_counts'])
         baseline['summary']['conjugation_type_counts'] = dict(baseline['summary']['conjugation_type_counts'])
@@ -153,8 +171,8 @@ class BaselineSnapshot:
     def save_baseline(self, baseline):
         """Save baseline to disk"""
         baseline_file = self.baseline_dir / 'baseline.json'
-        with open(baseline_file, 'w', encoding='utf-8') as f:
-            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        # Machine-read by regression_validator.py: compact (summary.json stays indented)
+        write_json(baseline_file, baseline, indent=False, atomic=True)
 
         print(f"\n💾 Baseline saved to: {baseline_file}")
         print(f"   📊 Summary:")
@@ -166,8 +184,7 @@ class BaselineSnapshot:
         print(f"      • Uncertain entries: {len(baseline['summary']['uncertain_roots'])}")
 
         summary_file = self.baseline_dir / 'summary.json'
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(baseline['summary'], f, ensure_ascii=False, indent=2)
+        write_json(summary_file, baseline['summary'], atomic=True)
 
         return baseline_file
 
@@ -177,8 +194,22 @@ class BaselineSnapshot:
         if not baseline_file.exists():
             return None
 
-        with open(baseline_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(baseline_file)
+
+    def load_previous_entries(self):
+        """Entries of the previous baseline by filename, as (root, entry)
+
+        Empty when there is no usable previous baseline: missing, unreadable,
+        or written with a different structure version.
+        """
+        try:
+            previous = self.load_baseline()
+            if not previous or previous['metadata'].get('structure_version') != STRUCTURE_VERSION:
+                return {}
+            return {entry['filename']: (root, entry) for root, entry in previous['verbs'].items()}
+        except Exception as e:
+            print(f"   ⚠️  Ignoring previous baseline: {e}")
+            return {}
 
     def report_baseline(self):
         """Display baseline information"""
@@ -21,8 +21,10 @@ Author: Claude Code
 Created: 2025-10-13
 """
 
+import importlib.util
 import unittest
 import sys
+import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -132,6 +134,19 @@ class TestStemParsing(unittest.TestCase):
         stems = self.parser.parse_stems(html)
         self.assertGreaterEqual(len(stems), 2)
 
+    def test_no_colon_stem_before_later_colon_header(self):
+        """A header without colon is kept when an earlier header's match runs up to a later 'II:'"""
+        font = '<font size="4"><b><span>'
+        tail = '</span></b></font></font><font><font><i><b><span>'
+        html = (
+            font + 'I' + tail + 'ʔamər/ʔomər</span>'
+            + font + 'III' + tail + 'mḥalləf/mḥaləf</span>'
+            + font + 'II:' + tail + 'mʕalləm/mʕaləm</span>'
+        )
+        stems = self.parser.parse_stems(html)
+        self.assertEqual([s['stem'] for s in stems], ['I', 'III'])
+        self.assertEqual(stems[1]['forms'], ['mḥalləf', 'mḥaləf'])
+
 
 class TestTokenGeneration(unittest.TestCase):
     """Test HTML to token conversion"""
@@ -195,6 +210,13 @@ class TestEdgeCases(unittest.TestCase):
         tokens = self.parser.html_to_tokens('')
         self.assertEqual(tokens, [])
 
+    def test_empty_source_file(self):
+        """An empty source file has no letter sections"""
+        with tempfile.TemporaryDirectory() as tmp:
+            html_path = Path(tmp) / 'empty.html'
+            html_path.write_bytes(b'')
+            self.assertEqual(TuroyoVerbParser(html_path).find_letter_sections(), [])
+
     def test_malformed_html(self):
         """Test handling of malformed HTML"""
         html = '<p>Unclosed tag'
@@ -222,6 +244,23 @@ class TestEdgeCases(unittest.TestCase):
             self.assertIn('&', raw_text)
 
 
+class TestCrossReferences(unittest.TestCase):
+    """Test cross-reference detection"""
+
+    def setUp(self):
+        self.parser = TuroyoVerbParser.__new__(TuroyoVerbParser)
+
+    def test_cross_reference_target(self):
+        """Test that the target root after the arrow is returned"""
+        html = '<p><span>ʔmr</span> <span>ʔmr → ʔmḏ</span></p>'
+        self.assertEqual(self.parser.find_cross_reference('ʔmr', html), 'ʔmḏ')
+
+    def test_no_arrow(self):
+        """Test that entries without an arrow are not cross-references"""
+        html = '<p><span>ʔmr</span> (&lt; MEA ʔmr)</p>'
+        self.assertIsNone(self.parser.find_cross_reference('ʔmr', html))
+
+
 class TestDataIntegrity(unittest.TestCase):
     """Test data integrity validation"""
 
@@ -283,6 +322,59 @@ class TestHomonymNumbering(unittest.TestCase):
         self.assertEqual(self.parser.verbs[0]['root'], 'ʔmr')
 
 
+@unittest.skipUnless(importlib.util.find_spec('docx'), 'python-docx not installed')
+class TestIdiomParagraph(unittest.TestCase):
+    """Test idiom paragraph parsing in the DOCX parser"""
+
+    def setUp(self):
+        from parse_docx_production import FixedDocxParser
+        self.parser = FixedDocxParser()
+
+    def test_phrase_meaning_and_example(self):
+        """Test phrase, meaning, example and reference of an idiom"""
+        idiom = self.parser.parse_idiom_paragraph('phrase: ʻmeaningʼ: turoyo ʻtrʼ 12/3')
+        self.assertEqual(idiom['phrase'], 'phrase')
+        self.assertEqual(idiom['meaning'], 'meaning')
+        self.assertEqual(idiom['examples'], [{'turoyo': 'turoyo', 'translation': 'tr', 'reference': '12/3'}])
+
+    def test_mixed_quote_styles(self):
+        """A meaning closed by a different quote mark is still split at its position"""
+        idiom = self.parser.parse_idiom_paragraph("phrase ʻmeaning' turoyo ʻtrʼ")
+        self.assertEqual(idiom['phrase'], 'phrase')
+        self.assertEqual(idiom['meaning'], 'meaning')
+        self.assertEqual(idiom['examples'][0]['turoyo'], 'turoyo')
+        self.assertEqual(idiom['examples'][0]['translation'], 'tr')
+
+
+@unittest.skipUnless(importlib.util.find_spec('docx'), 'python-docx not installed')
+class TestRawTokenSplit(unittest.TestCase):
+    """Test splitting non-italic DOCX text into tokens"""
+
+    def setUp(self):
+        from parse_docx_production import FixedDocxParser
+        self.parser = FixedDocxParser()
+
+    def test_reference_before_translation(self):
+        """Test a reference separated from the following translation"""
+        tokens = self.parser._split_raw_to_tokens('ab 12 ʻfooʼ')
+        self.assertEqual(tokens, [
+            {'kind': 'text', 'value': 'ab '},
+            {'kind': 'ref', 'value': '12'},
+            {'kind': 'text', 'value': ' '},
+            {'kind': 'translation', 'value': 'ʻfooʼ'},
+        ])
+
+    def test_digits_directly_before_modifier_quote(self):
+        """Digits right before ʻ (a word character) are not a reference"""
+        tokens = self.parser._split_raw_to_tokens('ab 12ʻfooʼ')
+        self.assertEqual(tokens, [
+            {'kind': 'text', 'value': 'ab 12'},
+            {'kind': 'translation', 'value': 'ʻfooʼ'},
+        ])
+        tokens = self.parser._split_raw_to_tokens('see LB 147ʻfooʼ')
+        self.assertNotIn('ref', [t['kind'] for t in tokens])
+
+
 def run_tests():
     """Run all tests"""
     loader = unittest.TestLoader()
@@ -294,7 +386,10 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestTokenGeneration))
     suite.addTests(loader.loadTestsFromTestCase(TestConjugationExtraction))
     suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
+    suite.addTests(loader.loadTestsFromTestCase(TestCrossReferences))
     suite.addTests(loader.loadTestsFromTestCase(TestHomonymNumbering))
+    suite.addTests(loader.loadTestsFromTestCase(TestIdiomParagraph))
+    suite.addTests(loader.loadTestsFromTestCase(TestRawTokenSplit))
 
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
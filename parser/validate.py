@@ -4,20 +4,56 @@ Validation and Verification Tools for Turoyo Data
 Generates reports for manual verification
 """
 
-import json
 from pathlib import Path
 from collections import defaultdict, Counter
+from types import MappingProxyType
+from typing import Mapping
 import random
 
+from json_output import load_json, write_json
+
+# Shared read-only defaults for missing fields (no fresh [] / {} per lookup)
+_EMPTY = ()
+_EMPTY_MAP: Mapping[str, list] = MappingProxyType({})
+
+
+def _count_examples(stems):
+    """Total number of examples across the conjugations of a verb's stems"""
+    total = 0
+    for stem in stems:
+        conjugations = stem.get('conjugations')
+        if conjugations:
+            for examples in conjugations.values():
+                total += len(examples)
+    return total
+
+
+def _classify_reference(ref):
+    """Bucket a reference string for the reference pattern statistics"""
+    if '/' in ref:
+        return 'page_reference'
+    if ref.isupper():
+        return 'abbreviation'
+    if ref.isdigit():
+        return 'number_only'
+    return 'mixed'
+
+
 class TuroyoValidator:
     def __init__(self, json_path):
-        with open(json_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        self.data = load_json(json_path)
 
         self.verbs = self.data['verbs']
         self.metadata = self.data['metadata']
         self.issues = defaultdict(list)
         self.stats = defaultdict(int)
+        self._example_counts = None
+
+    def example_counts(self):
+        """Number of examples per verb, aligned with self.verbs (computed once)"""
+        if self._example_counts is None:
+            self._example_counts = [_count_examples(verb.get('stems', _EMPTY)) for verb in self.verbs]
+        return self._example_counts
 
     def validate_all(self):
         """Run all validation checks"""
@@ -65,15 +101,15 @@ class TuroyoValidator:
         print("  Checking data quality...")
 
         for verb in self.verbs:
-            for stem in verb.get('stems', []):
-                for conj_type, examples in stem.get('conjugations', {}).items():
+            for stem in verb.get('stems', _EMPTY):
+                for conj_type, examples in stem.get('conjugations', _EMPTY_MAP).items():
                     for example in examples:
-                        if not example.get('turoyo'):
+                        turoyo = example.get('turoyo', '')
+                        if not turoyo:
                             self.issues['empty_turoyo'].append(
                                 f"{verb['root']} - {stem['stem']} - {conj_type}"
                             )
 
-                        turoyo = example.get('turoyo', '')
                         if turoyo and len(turoyo.strip()) < 3:
                             self.issues['short_turoyo'].append(
                                 f"{verb['root']}: '{turoyo}'"
@@ -91,13 +127,11 @@ class TuroyoValidator:
         """Analyze etymology data"""
         print("  Checking etymology...")
 
-        sources = Counter()
-
-        for verb in self.verbs:
-            etym = verb.get('etymology')
-            if etym:
-                source = etym.get('source', 'unknown')
-                sources[source] += 1
+        sources = Counter(
+            verb['etymology'].get('source', 'unknown')
+            for verb in self.verbs
+            if verb.get('etymology')
+        )
 
         self.stats['etymology_sources'] = dict(sources)
 
@@ -105,17 +139,8 @@ class TuroyoValidator:
         """Analyze examples"""
         print("  Checking examples...")
 
-        total_examples = 0
-        examples_per_verb = []
-
-        for verb in self.verbs:
-            verb_examples = 0
-            for stem in verb.get('stems', []):
-                for conj_type, examples in stem.get('conjugations', {}).items():
-                    verb_examples += len(examples)
-                    total_examples += len(examples)
-
-            examples_per_verb.append(verb_examples)
+        examples_per_verb = self.example_counts()
+        total_examples = sum(examples_per_verb)
 
         self.stats['total_examples'] = total_examples
         self.stats['avg_examples_per_verb'] = total_examples / len(self.verbs) if self.verbs else 0
@@ -129,18 +154,10 @@ class TuroyoValidator:
         ref_patterns = Counter()
 
         for verb in self.verbs:
-            for stem in verb.get('stems', []):
-                for conj_type, examples in stem.get('conjugations', {}).items():
+            for stem in verb.get('stems', _EMPTY):
+                for examples in stem.get('conjugations', _EMPTY_MAP).values():
                     for example in examples:
-                        for ref in example.get('references', []):
-                            if '/' in ref:
-                                ref_patterns['page_reference'] += 1
-                            elif ref.isupper():
-                                ref_patterns['abbreviation'] += 1
-                            elif ref.isdigit():
-                                ref_patterns['number_only'] += 1
-                            else:
-                                ref_patterns['mixed'] += 1
+                        ref_patterns.update(map(_classify_reference, example.get('references', _EMPTY)))
 
         self.stats['reference_patterns'] = dict(ref_patterns)
 
@@ -149,12 +166,13 @@ class TuroyoValidator:
         print("  Detecting anomalies...")
 
         for verb in self.verbs:
-            if len(verb.get('stems', [])) > 8:
+            verb_stems = verb.get('stems', _EMPTY)
+            if len(verb_stems) > 8:
                 self.issues['too_many_stems'].append(
-                    f"{verb['root']}: {len(verb['stems'])} stems"
+                    f"{verb['root']}: {len(verb_stems)} stems"
                 )
 
-            stems = [s['stem'] for s in verb.get('stems', [])]
+            stems = [s['stem'] for s in verb_stems]
             if len(stems) != len(set(stems)):
                 self.issues['duplicate_stems'].append(verb['root'])
 
@@ -202,21 +220,14 @@ class TuroyoValidator:
         output_dir.mkdir(exist_ok=True)
 
         random_sample = random.sample(self.verbs, min(20, len(self.verbs)))
-        with open(output_dir / 'random_sample.json', 'w', encoding='utf-8') as f:
-            json.dump(random_sample, f, ensure_ascii=False, indent=2)
+        write_json(output_dir / 'random_sample.json', random_sample)
 
-        verbs_with_counts = [
-            (v, sum(len(examples) for stem in v.get('stems', [])
-                    for examples in stem.get('conjugations', {}).values()))
-            for v in self.verbs
-        ]
+        verbs_with_counts = list(zip(self.verbs, self.example_counts()))
         top_examples = sorted(verbs_with_counts, key=lambda x: -x[1])[:10]
-        with open(output_dir / 'top_examples.json', 'w', encoding='utf-8') as f:
-            json.dump([v[0] for v in top_examples], f, ensure_ascii=False, indent=2)
+        write_json(output_dir / 'top_examples.json', [v[0] for v in top_examples])
 
         verbs_by_stems = sorted(self.verbs, key=lambda v: -len(v.get('stems', [])))[:10]
-        with open(output_dir / 'most_stems.json', 'w', encoding='utf-8') as f:
-            json.dump(verbs_by_stems, f, ensure_ascii=False, indent=2)
+        write_json(output_dir / 'most_stems.json', verbs_by_stems)
 
         issues_sample = {
             'missing_etymology': self.issues.get('missing_etymology', [])[:10],
@@ -226,12 +237,10 @@ class TuroyoValidator:
             'too_many_stems': self.issues.get('too_many_stems', [])[:10],
         }
 
-        with open(output_dir / 'issues_sample.json', 'w', encoding='utf-8') as f:
-            json.dump(issues_sample, f, ensure_ascii=False, indent=2)
+        write_json(output_dir / 'issues_sample.json', issues_sample)
 
         uncertain = [v for v in self.verbs if v.get('uncertain')]
-        with open(output_dir / 'uncertain_entries.json', 'w', encoding='utf-8') as f:
-            json.dump(uncertain, f, ensure_ascii=False, indent=2)
+        write_json(output_dir / 'uncertain_entries.json', uncertain)
 
         print(f"\n📁 Verification samples saved to: {output_dir}/")
         print("  - random_sample.json (20 random verbs)")
@@ -285,13 +294,11 @@ class TuroyoValidator:
         </tr>
 """
 
-        for verb in self.verbs[:20]:
+        for verb, num_examples in zip(self.verbs[:20], self.example_counts()):
             etym = verb.get('etymology') or {}
             etym_str = f"{etym.get('source', 'N/A')}" if isinstance(etym, dict) else 'N/A'
 
             num_stems = len(verb.get('stems', []))
-            num_examples = sum(len(examples) for stem in verb.get('stems', [])
-                               for examples in stem.get('conjugations', {}).values())
 
             html += f"""
         <tr>
@@ -315,7 +322,7 @@ class TuroyoValidator:
 
 
 def main():
-        json_file = Path('.devkit/analysis/html_legacy/verbs.json')
+    json_file = Path('.devkit/analysis/html_legacy/verbs.json')
 
     if not json_file.exists():
         print(f"❌ {json_file} not found. Run extract_final.py first.")
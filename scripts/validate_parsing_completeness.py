@@ -18,11 +18,23 @@ Usage:
 import json
 import re
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import ModuleType
 from collections import Counter, defaultdict
-from typing import Set, List, Dict, Any
+from typing import Set, List, Dict, Any, Optional
 from docx import Document
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Word tokenizer and chunk delimiters, compiled once for every text fragment
+_WORD = re.compile(r'[\w\u0300-\u036F]+')
+_CHUNK_DELIMITERS = re.compile(r'[,;.!?\n\r\t]+')
+
 
 class TextExtractor:
     """Extracts and normalizes text for comparison."""
@@ -46,7 +58,7 @@ class TextExtractor:
         """Split text into words, preserving Unicode characters and diacritics."""
         # Extract words with Unicode letters, combining diacritics, numbers
         # This preserves Turoyo characters like ḥ, ṭ, ḏ̣, etc.
-        words = re.findall(r'[\w\u0300-\u036F]+', text, re.UNICODE)
+        words = _WORD.findall(text)
 
         # Filter out single characters and normalize
         return [TextExtractor.normalize(w) for w in words if len(w) > 0]
@@ -57,7 +69,7 @@ class TextExtractor:
         chunks = set()
 
         # Split by common delimiters
-        parts = re.split(r'[,;.!?\n\r\t]+', text)
+        parts = _CHUNK_DELIMITERS.split(text)
 
         for part in parts:
             normalized = TextExtractor.normalize(part)
@@ -75,8 +87,8 @@ class DocxTextExtractor:
         self.all_text: List[str] = []
         self.file_texts: Dict[str, List[str]] = defaultdict(list)
 
-    def extract_all(self) -> List[str]:
-        """Extract text from all DOCX files."""
+    def extract_all(self, workers=None) -> List[str]:
+        """Extract text from all DOCX files (workers: process count, default os.cpu_count())."""
         docx_files = sorted(self.docx_dir.glob('*.docx'))
 
         if not docx_files:
@@ -84,18 +96,19 @@ class DocxTextExtractor:
 
         print(f"Extracting from {len(docx_files)} DOCX files...")
 
-        for docx_file in docx_files:
-            if docx_file.name.startswith('~$'):
-                continue
+        docx_files = [f for f in docx_files if not f.name.startswith('~$')]
 
-            print(f"  - {docx_file.name}")
-            texts = self._extract_from_file(docx_file)
-            self.file_texts[docx_file.name] = texts
-            self.all_text.extend(texts)
+        # Files are independent: load them in worker processes, collect in order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for docx_file, texts in zip(docx_files, executor.map(self._extract_from_file, docx_files)):
+                print(f"  - {docx_file.name}")
+                self.file_texts[docx_file.name] = texts
+                self.all_text.extend(texts)
 
         return self.all_text
 
-    def _extract_from_file(self, docx_file: Path) -> List[str]:
+    @staticmethod
+    def _extract_from_file(docx_file: Path) -> List[str]:
         """Extract all text from a single DOCX file."""
         doc = Document(docx_file)
         texts = []
@@ -136,9 +149,10 @@ class JsonTextExtractor:
 
         print(f"Extracting from {len(json_files)} JSON files...")
 
+        loads = orjson.loads if orjson is not None else json.loads
+
         for json_file in json_files:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                verb = json.load(f)
+            verb = loads(json_file.read_bytes())
 
             texts = self._extract_from_verb(verb)
             self.verb_texts[json_file.stem] = texts
@@ -208,13 +222,16 @@ class ParsingValidator:
 
         # Process text
         print("Tokenizing and analyzing...")
-        for text in docx_texts:
-            self.docx_words.update(TextExtractor.tokenize(text))
-            self.docx_chunks.update(TextExtractor.extract_meaningful_chunks(text))
+        # One regex scan over all fragments instead of one call per fragment:
+        # '\n' is neither a word character nor part of a chunk, so joining
+        # cannot merge words or chunks across fragments
+        docx_corpus = '\n'.join(docx_texts)
+        self.docx_words.update(TextExtractor.tokenize(docx_corpus))
+        self.docx_chunks.update(TextExtractor.extract_meaningful_chunks(docx_corpus))
 
-        for text in json_texts:
-            self.json_words.update(TextExtractor.tokenize(text))
-            self.json_chunks.update(TextExtractor.extract_meaningful_chunks(text))
+        json_corpus = '\n'.join(json_texts)
+        self.json_words.update(TextExtractor.tokenize(json_corpus))
+        self.json_chunks.update(TextExtractor.extract_meaningful_chunks(json_corpus))
 
         print()
         print("=" * 70)
@@ -236,7 +253,8 @@ class ParsingValidator:
         print()
 
         # Find missing words
-        missing_words = set(self.docx_words.keys()) - set(self.json_words.keys())
+        # keys() views subtract as sets without copying both vocabularies first
+        missing_words = self.docx_words.keys() - self.json_words.keys()
         missing_word_occurrences = sum(self.docx_words[w] for w in missing_words)
 
         # Calculate word coverage
@@ -380,8 +398,7 @@ def main():
             'missing_chunks_sample': sorted(results['missing_chunks'])[:50],
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(json_results, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(json.dumps(json_results, indent=2, ensure_ascii=False).encode('utf-8'))
 
         print(f"Detailed report saved to: {output_file}")
         print()